@@ -0,0 +1,108 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+from main import (get_safe_math_context, make_user_func, method_gauss_legendre_composite,
+                  method_simpson_parallel, shared_grid_sums)
+
+FUNC_STR = "x * sin(x**2)"
+A, B = 0.0, 3.0
+
+
+def legacy_user_func(func_str):
+    # Стара реалізація: копія контексту та eval рядка на кожен виклик
+    math_context = get_safe_math_context()
+
+    def user_func(x):
+        local_context = math_context.copy()
+        local_context['x'] = x
+        return eval(func_str, {"__builtins__": {}}, local_context)
+
+    return user_func
+
+
+def scalar_sum(func, calls):
+    h = (B - A) / calls
+    return sum(func(A + i * h) for i in range(calls))
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    value = fn(*args)
+    return value, time.perf_counter() - start
+
+
+def bench_expression_cache(max_calls=10 ** 5):
+    print("Кеш скомпільованих виразів: затримка на одне обчислення f(x)")
+    print("  до — eval рядка на кожен вузол; після — скомпільований вираз на спільній сітці 2n+1 вузлів")
+    print(f"{'n':>10} {'до, мкс':>12} {'після, мкс':>12} {'після, с':>10} {'прискорення':>12}")
+    extrapolated = False
+    for p in range(2, 8):
+        n = 10 ** p
+        # Стара версія для n > max_calls міряється на підвибірці (інакше бенчмарк триває години),
+        # нова — завжди на всіх 2n+1 вузлах
+        calls = min(n, max_calls)
+        _, t_old = timed(lambda: scalar_sum(legacy_user_func(FUNC_STR), calls))
+        (_, evaluations, path), t_new = timed(shared_grid_sums, make_user_func(FUNC_STR), A, B, n)
+        per_old = t_old / calls * 1e6
+        per_new = t_new / evaluations * 1e6
+        mark = "*" if calls < n else " "
+        extrapolated = extrapolated or calls < n
+        print(f"{n:>10} {per_old:>11.3f}{mark} {per_new:>12.4f} {t_new:>10.3f} {per_old / per_new:>11.1f}x  {path}")
+    if extrapolated:
+        print(f"  * стара версія виміряна на {max_calls} викликах; для повних n це екстраполяція "
+              f"(затримка на виклик від n не залежить)")
+
+
+def legacy_gauss_legendre(func, a, b, deg):
+    # Стара реалізація без кешу вузлів (обмеження степеня 90 прибране, щоб порівнювати до 500)
+    x_gauss, w_gauss = np.polynomial.legendre.leggauss(deg)
+    t = 0.5 * (x_gauss + 1) * (b - a) + a
+    return 0.5 * (b - a) * np.sum(w_gauss * func(t))
+
+
+def bench_gauss_nodes(repeats=20):
+    func_str, a, b = "sin(40 * x) * exp(-x)", 0.0, 3.0
+    exact = (40 - np.exp(-b) * (np.sin(40 * b) + 40 * np.cos(40 * b))) / 1601
+    func = make_user_func(func_str)
+    print(f"Гаусс–Лежандр: {func_str} на [{a}, {b}]")
+    print(f"{'k':>5} {'без кешу, мс':>14} {'з кешем, мс':>13} {'похибка 1 панелі':>18} "
+          f"{'похибка k/5 x 5':>16}")
+    for deg in (5, 10, 20, 50, 90, 200, 500):
+        _, t_old = timed(lambda: [legacy_gauss_legendre(func, a, b, deg) for _ in range(repeats)])
+        # Одна панель складеної формули — той самий Гаусс, але з кешем і без обмеження 90
+        method_gauss_legendre_composite(func, a, b, 1, deg)
+        value, t_new = timed(lambda: [method_gauss_legendre_composite(func, a, b, 1, deg)
+                                      for _ in range(repeats)])
+        composite = method_gauss_legendre_composite(func, a, b, max(1, deg // 5), 5)
+        print(f"{deg:>5} {t_old / repeats * 1e3:>14.4f} {t_new / repeats * 1e3:>13.4f} "
+              f"{abs(value[0] - exact):>18.2e} {abs(composite - exact):>16.2e}")
+
+
+def bench_parallel(n=10 ** 8):
+    func_str, a, b = "x * sin(x**2)", 0.0, 3.0
+    exact = (1 - np.cos(9.0)) / 2
+    cores = os.cpu_count() or 1
+    workers_list = sorted({1, 2, 4, 8, 16, cores} & set(range(1, cores + 1)))
+    print(f"Паралельний Сімпсон: {func_str} на [{a}, {b}], n = {n}, ядер: {cores}")
+    print(f"{'процесів':>9} {'час, с':>9} {'прискорення':>12} {'похибка':>10}")
+    base = None
+    for workers in workers_list:
+        value, t = timed(method_simpson_parallel, func_str, a, b, n, workers)
+        base = base or t
+        print(f"{workers:>9} {t:>9.2f} {base / t:>11.2f}x {abs(value - exact):>10.2e}")
+
+
+BENCHMARKS = {
+    "cache": bench_expression_cache,
+    "gauss": bench_gauss_nodes,
+    "parallel": bench_parallel,
+}
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        BENCHMARKS[name]()
+        print()
@@ -1,8 +1,21 @@
 import eel
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
+from matplotlib.figure import Figure
 import io
 import base64
+import ast
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+# Планувальник обчислень і кеш графіків спільні з ProjectFolder
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from eel_jobs import JobScheduler, PlotCache
+
+matplotlib.use('Agg')
 
 eel.init('web')
 
@@ -13,110 +26,603 @@ def get_safe_math_context():
     return safe_dict
 
 
-def method_rectangle_left(func, a, b, n):
-    h = (b - a) / n
-    return sum(func(a + i * h) for i in range(n)) * h
+# Контекст numpy будується один раз на весь процес
+MATH_CONTEXT = get_safe_math_context()
+MATH_CONTEXT['__builtins__'] = {}
 
 
-def method_rectangle_right(func, a, b, n):
-    h = (b - a) / n
-    return sum(func(a + (i + 1) * h) for i in range(n)) * h
+def normalize_expression(func_str):
+    # Однаковий вираз з різними пробілами/дужками дає однаковий ключ кешу
+    return ast.unparse(ast.parse(func_str.strip(), mode='eval'))
 
 
-def method_rectangle_middle(func, a, b, n):
-    h = (b - a) / n
-    return sum(func(a + (i + 0.5) * h) for i in range(n)) * h
+def validate_expression(tree):
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            if node.id != 'x' and node.id not in MATH_CONTEXT:
+                raise ValueError(f"Невідоме ім'я у виразі: {node.id}")
+            if node.id.startswith('_'):
+                raise ValueError(f"Заборонене ім'я у виразі: {node.id}")
+        elif isinstance(node, ast.Attribute) and node.attr.startswith('_'):
+            raise ValueError(f"Заборонений атрибут у виразі: {node.attr}")
+        elif isinstance(node, (ast.Lambda, ast.NamedExpr)):
+            raise ValueError("Недопустима конструкція у виразі")
+
+
+@lru_cache(maxsize=128)
+def compile_expression(normalized_str):
+    tree = ast.parse(normalized_str, mode='eval')
+    validate_expression(tree)
+    # Вираз компілюється в звичайну функцію lambda x: ..., тож виклик не парсить рядок знову
+    code = compile(f"lambda x: ({normalized_str})", '<f(x)>', 'eval')
+    return eval(code, MATH_CONTEXT)
+
+
+def make_user_func(func_str):
+    return compile_expression(normalize_expression(func_str))
+
+
+# Максимальна кількість вузлів, що обчислюються за один виклик f(x)
+CHUNK_SIZE = 10 ** 6
+
+
+def evaluate_on_nodes(func, x):
+    y = np.asarray(func(x), dtype=float)
+    if y.shape != x.shape:
+        # Константа (напр. "5") повертає скаляр — розтягуємо на всю сітку
+        if y.size != 1:
+            raise ValueError("Вираз не векторизується")
+        y = np.broadcast_to(y.reshape(()), x.shape)
+    return y
+
 
+def check_vectorized(func, x, y):
+    # Вирази на кшталт max(x) згортають масив у скаляр — звіряємо з поелементним обчисленням
+    for k in (0, -1):
+        if not np.isclose(float(func(float(x[k]))), y[k], equal_nan=True):
+            raise ValueError("Вираз не векторизується")
 
-def method_trapezoidal(func, a, b, n):
-    # Метод трапецій
+
+def shared_grid_sums(func, a, b, n, previous=None):
+    # f обчислюється один раз на об'єднаній сітці з кроком h/2: вузли j = 0..2n,
+    # парні — n+1 кінців відрізків, непарні — n середин. Усі правила на рівномірній сітці
+    # (прямокутники, трапеції, Сімпсон) виводяться з цих сум у rules_from_sums.
+    # Шлях обчислення (vector / chunked / scalar) повертається і показується в інтерфейсі.
+    # previous — суми (n, кінці, середини, f(a), f(b)) з меншої сітки; якщо n кратне її n,
+    # старі вузли є підмножиною нової сітки і повторно не обчислюються.
+    h = (b - a) / n
+    count = 2 * n + 1
+    step = n // previous[0] if previous and n % previous[0] == 0 else 0
+    if step:
+        _, old_ends, old_mids, f_a, f_b = previous
+        # Старий вузол j стає вузлом j*step: при парному step середини теж стають кінцями
+        old_ends, old_mids = (old_ends + old_mids, 0.0) if step % 2 == 0 else (old_ends, old_mids)
+    else:
+        old_ends = old_mids = 0.0
+
+    try:
+        new_ends = new_mids = 0.0
+        evaluations = 0
+        for begin in range(0, count, CHUNK_SIZE):
+            j = np.arange(begin, min(begin + CHUNK_SIZE, count))
+            if step:
+                j = j[j % step != 0]
+            if j.size == 0:
+                continue
+            x = a + j * (0.5 * h)
+            y = evaluate_on_nodes(func, x)
+            if evaluations == 0:
+                check_vectorized(func, x, y)
+            if not step and begin == 0:
+                f_a = y[0]
+            is_end = j % 2 == 0
+            new_ends += np.sum(y[is_end])
+            new_mids += np.sum(y[~is_end])
+            evaluations += j.size
+        if not step:
+            f_b = y[-1]
+        path = "vector" if count <= CHUNK_SIZE else "chunked"
+    except (TypeError, ValueError):
+        # Поелементний шлях теж іде блоками CHUNK_SIZE, щоб списки не росли разом з n
+        new_ends = new_mids = 0.0
+        evaluations = 0
+        for begin in range(0, count, CHUNK_SIZE):
+            nodes = [j for j in range(begin, min(begin + CHUNK_SIZE, count)) if not step or j % step]
+            values = [func(a + j * (0.5 * h)) for j in nodes]
+            if not step and begin == 0:
+                f_a = values[0]
+            new_ends += sum(v for j, v in zip(nodes, values) if j % 2 == 0)
+            new_mids += sum(v for j, v in zip(nodes, values) if j % 2 == 1)
+            evaluations += len(nodes)
+        if not step:
+            f_b = values[-1]
+        path = "scalar"
+
+    return (n, old_ends + new_ends, old_mids + new_mids, f_a, f_b), evaluations, path
+
+
+def rules_from_sums(sums, a, b):
+    n, sum_ends, sum_mids, f_a, f_b = sums
+    h = (b - a) / n
+    trapezoid = h * (sum_ends - 0.5 * (f_a + f_b))
+    rect_mid = h * sum_mids
+    return {
+        "rect_left": float(h * (sum_ends - f_b)),
+        "rect_right": float(h * (sum_ends - f_a)),
+        "rect_mid": float(rect_mid),
+        "trapezoid": float(trapezoid),
+        # Сімпсон на кожному відрізку [x_i, x_i+1] з його серединою: S = (T + 2M) / 3.
+        # Це складений Сімпсон на 2n півкроках h/2, а не на n відрізках, як було раніше,
+        # тож для того самого n значення точніше й відрізняється від старого
+        "simpson": float((trapezoid + 2 * rect_mid) / 3),
+    }
+
+
+def integrate_on_shared_grid(func, a, b, n):
+    # Усі п'ять правил на рівномірній сітці виводяться з однієї вибірки f
+    sums, evaluations, path = shared_grid_sums(func, a, b, n)
+    return rules_from_sums(sums, a, b), evaluations, path
+
+
+# Кеш вузлів і ваг Гаусса–Лежандра за степенем
+GAUSS_NODES_CACHE = {}
+MAX_GAUSS_DEG = 90
+GAUSS_PANEL_DEG = 20
+GAUSS_NODES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gauss_nodes.npz')
+
+
+def gauss_legendre_nodes(deg):
+    if deg not in GAUSS_NODES_CACHE:
+        GAUSS_NODES_CACHE[deg] = np.polynomial.legendre.leggauss(deg)
+        # Квадратури рахуються в процесах планувальника, тож нові вузли одразу йдуть на диск,
+        # звідки їх прочитають інші процеси й наступні запуски
+        try:
+            save_gauss_nodes(GAUSS_NODES_FILE)
+        except OSError:
+            pass
+    return GAUSS_NODES_CACHE[deg]
+
+
+def precompute_gauss_nodes(degrees=range(1, MAX_GAUSS_DEG + 1)):
+    for deg in degrees:
+        if deg not in GAUSS_NODES_CACHE:
+            GAUSS_NODES_CACHE[deg] = np.polynomial.legendre.leggauss(deg)
+    save_gauss_nodes(GAUSS_NODES_FILE)
+
+
+def save_gauss_nodes(path):
+    # Вузли, які тим часом записав інший процес, не губляться; файл замінюється цілком,
+    # тож процес, що читає, не побачить його напівзаписаним
+    if os.path.exists(path):
+        load_gauss_nodes(path)
+    arrays = {}
+    for deg, (x, w) in GAUSS_NODES_CACHE.items():
+        arrays[f"x{deg}"] = x
+        arrays[f"w{deg}"] = w
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_path, path)
+
+
+def load_gauss_nodes(path):
+    with np.load(path) as data:
+        for key in data.files:
+            if key.startswith("x"):
+                deg = int(key[1:])
+                GAUSS_NODES_CACHE.setdefault(deg, (data[key], data[f"w{deg}"]))
+
+
+# Завантаження під час імпорту: під spawn процеси планувальника імпортують модуль заново
+# і не бачать кешу батьківського процесу
+if os.path.exists(GAUSS_NODES_FILE):
+    try:
+        load_gauss_nodes(GAUSS_NODES_FILE)
+    except (OSError, ValueError, KeyError):
+        pass
+
+
+def method_gauss_legendre_composite(func, a, b, panels, deg):
+    # Складений Гаусс: m відрізків по k вузлів, усі m*k точок — у векторизованих блоках
+    x_gauss, w_gauss = gauss_legendre_nodes(deg)
+    h = (b - a) / panels
+    block = max(1, CHUNK_SIZE // deg)
+    total = 0.0
+    for begin in range(0, panels, block):
+        lefts = a + np.arange(begin, min(begin + block, panels)) * h
+        t = lefts[:, None] + 0.5 * h * (x_gauss[None, :] + 1)
+        y = evaluate_batch(func, t.ravel()).reshape(t.shape)
+        total += np.sum(y @ w_gauss)
+    return float(0.5 * h * total)
+
+
+def gauss_panels(n):
+    # До MAX_GAUSS_DEG вузлів — одна панель; далі — панелі по GAUSS_PANEL_DEG вузлів
+    if n <= MAX_GAUSS_DEG:
+        return 1, n
+    return -(-n // GAUSS_PANEL_DEG), GAUSS_PANEL_DEG
+
+
+# Вузли та ваги правила Гаусса–Кронрода G7–K15 на [-1, 1] (QUADPACK)
+_XGK = np.array([0.991455371120812639206854697526329, 0.949107912342758524526189684047851,
+                 0.864864423359769072789712788640926, 0.741531185599394439863864773280788,
+                 0.586087235467691130294144845693013, 0.405845151377397166906606412076961,
+                 0.207784955007898467600689403773245, 0.0])
+_WGK = np.array([0.022935322010529224963732008058970, 0.063092092629978553290700663189204,
+                 0.104790010322250183839876322541518, 0.140653259715525918745189590510238,
+                 0.169004726639267902826583426598550, 0.190350578064785409913256402421014,
+                 0.204432940075298892414161999234649, 0.209482141084727828012999174891714])
+_WG = np.array([0.129484966168869693270611432679082, 0.279705391489276667901467771423780,
+                0.381830050505118944950369775488975, 0.417959183673469387755102040816327])
+
+KRONROD_NODES = np.concatenate([-_XGK[:-1], _XGK[::-1]])
+KRONROD_WEIGHTS = np.concatenate([_WGK[:-1], _WGK[::-1]])
+# Вузли Гаусса G7 — непарні позиції серед 15 вузлів Кронрода
+GAUSS7_WEIGHTS = np.zeros(15)
+GAUSS7_WEIGHTS[1::2] = np.concatenate([_WG[:-1], _WG[::-1]])
+
+
+def evaluate_batch(func, x):
+    try:
+        y = evaluate_on_nodes(func, x)
+        check_vectorized(func, x, y)
+        return y
+    except (TypeError, ValueError):
+        return np.array([float(func(t)) for t in x])
+
+
+def gauss_kronrod_batch(func, lefts, rights):
+    # Відрізки обчислюються блоками: один виклик f на масиві до CHUNK_SIZE вузлів (rows x 15)
+    centers = 0.5 * (lefts + rights)
+    half = 0.5 * (rights - lefts)
+    kronrod = np.empty(len(lefts))
+    gauss = np.empty(len(lefts))
+    block = max(1, CHUNK_SIZE // len(KRONROD_NODES))
+    for begin in range(0, len(lefts), block):
+        rows = slice(begin, begin + block)
+        x = centers[rows, None] + half[rows, None] * KRONROD_NODES[None, :]
+        y = evaluate_batch(func, x.ravel()).reshape(x.shape)
+        kronrod[rows] = half[rows] * (y @ KRONROD_WEIGHTS)
+        gauss[rows] = half[rows] * (y @ GAUSS7_WEIGHTS)
+    return kronrod, np.abs(kronrod - gauss)
+
+
+def method_adaptive_gauss_kronrod(func, a, b, abs_tol=1e-10, rel_tol=1e-10, max_evals=100000):
+    # Адаптивне інтегрування: діляться навпіл лише відрізки, похибка яких більша
+    # за їхню частку допуску; повертає (значення, оцінка похибки, обчислень f, чи збіглося)
+    lefts = np.array([a], dtype=float)
+    rights = np.array([b], dtype=float)
+    values, errors = gauss_kronrod_batch(func, lefts, rights)
+    evaluations = 15
+    done_value = done_error = 0.0
+    width = abs(b - a) or 1.0
+
+    while True:
+        total = done_value + np.sum(values)
+        total_error = done_error + np.sum(errors)
+        target = max(abs_tol, rel_tol * abs(total))
+        if total_error <= target:
+            return float(total), float(total_error), evaluations, True
+
+        budget = (max_evals - evaluations) // 30
+        if budget <= 0:
+            return float(total), float(total_error), evaluations, False
+
+        need = errors > target * np.abs(rights - lefts) / width
+        if not need.any():
+            need[np.argmax(errors)] = True
+
+        # Відрізки, що вже вклалися у свою частку допуску, більше не уточнюються
+        done_value += np.sum(values[~need])
+        done_error += np.sum(errors[~need])
+        lefts, rights, values, errors = lefts[need], rights[need], values[need], errors[need]
+
+        # Якщо бюджету не вистачає на всі, ділимо відрізки з найбільшою похибкою
+        order = np.argsort(errors)[::-1]
+        split, keep = order[:budget], order[budget:]
+        mids = 0.5 * (lefts[split] + rights[split])
+        new_lefts = np.concatenate([lefts[split], mids])
+        new_rights = np.concatenate([mids, rights[split]])
+        new_values, new_errors = gauss_kronrod_batch(func, new_lefts, new_rights)
+        evaluations += 15 * len(new_lefts)
+
+        lefts = np.concatenate([lefts[keep], new_lefts])
+        rights = np.concatenate([rights[keep], new_rights])
+        values = np.concatenate([values[keep], new_values])
+        errors = np.concatenate([errors[keep], new_errors])
+
+
+def method_romberg(func, a, b, abs_tol=1e-12, rel_tol=1e-12, max_evals=100000, max_levels=30):
+    # Метод Ромберга: сітка трапецій подвоюється, а на кожному рівні обчислюються лише нові середини.
+    # Повертає (значення, оцінка похибки, таблиця Ромберга, обчислень f, чи збіглося).
+    # Оцінка похибки — None, якщо бюджету не вистачило навіть на другий рядок таблиці
+    # (inf eel передав би як Infinity, а це не JSON)
+    h = b - a
+    f_ends = evaluate_batch(func, np.array([a, b], dtype=float))
+    table = [[0.5 * h * float(np.sum(f_ends))]]
+    evaluations = 2
+    error = None
+
+    for k in range(1, max_levels):
+        count = 2 ** (k - 1)
+        if evaluations + count > max_evals:
+            break
+        h *= 0.5
+        # Нові середини обчислюються блоками до CHUNK_SIZE вузлів
+        mids_sum = 0.0
+        for begin in range(0, count, CHUNK_SIZE):
+            mids = a + (2 * np.arange(begin, min(begin + CHUNK_SIZE, count)) + 1) * h
+            mids_sum += float(np.sum(evaluate_batch(func, mids)))
+        trapezoid = 0.5 * table[-1][0] + h * mids_sum
+        evaluations += count
+
+        # Екстраполяція Річардсона вздовж рядка таблиці
+        row = [trapezoid]
+        for j in range(1, k + 1):
+            factor = 4 ** j
+            row.append((factor * row[j - 1] - table[-1][j - 1]) / (factor - 1))
+        table.append(row)
+
+        error = abs(row[-1] - table[-2][-1])
+        if k >= 2 and error <= max(abs_tol, rel_tol * abs(row[-1])):
+            return row[-1], error, table, evaluations, True
+
+    return table[-1][-1], error, table, evaluations, False
+
+
+def _grid_parity_sums(func_str, a, h, begin, end):
+    # Робоча функція процесу: суми f(a + j*h) для парних і непарних j з [begin, end).
+    # Пам'ять обмежена одним блоком CHUNK_SIZE, блокові суми додаються через math.fsum.
+    func = make_user_func(func_str)
+    even, odd = [], []
+    for start in range(begin, end, CHUNK_SIZE):
+        x = a + np.arange(start, min(start + CHUNK_SIZE, end)) * h
+        y = evaluate_batch(func, x)
+        shift = start % 2
+        even.append(float(np.sum(y[shift::2])))
+        odd.append(float(np.sum(y[1 - shift::2])))
+    return math.fsum(even), math.fsum(odd)
+
+
+def parallel_grid_sums(func_str, a, b, n, workers=None):
+    # Вузли 0..n рівномірної сітки діляться на суцільні діапазони — по одному на процес
+    workers = workers or os.cpu_count() or 1
     h = (b - a) / n
-    x = np.linspace(a, b, n + 1)
-    y = func(x)
-    return np.trapz(y, x)
+    bounds = np.linspace(0, n + 1, workers + 1).astype(int)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(_grid_parity_sums, [func_str] * workers, [a] * workers, [h] * workers,
+                              bounds[:-1].tolist(), bounds[1:].tolist()))
+    ends = evaluate_batch(make_user_func(func_str), np.array([a, a + n * h]))
+    return math.fsum(p[0] for p in parts), math.fsum(p[1] for p in parts), ends[0], ends[1], h
 
 
-def method_simpson(func, a, b, n):
+def method_trapezoidal_parallel(func_str, a, b, n, workers=None):
+    sum_even, sum_odd, f_a, f_b, h = parallel_grid_sums(func_str, a, b, n, workers)
+    return h * math.fsum([sum_even, sum_odd, -0.5 * f_a, -0.5 * f_b])
+
+
+def method_simpson_parallel(func_str, a, b, n, workers=None):
     if n % 2 != 0: n += 1
-    h = (b - a) / n
-    x = np.linspace(a, b, n + 1)
-    y = func(x)
+    sum_even, sum_odd, f_a, f_b, h = parallel_grid_sums(func_str, a, b, n, workers)
+    # f(a) та f(b) входять у парні вузли з вагою 2, а мають вагу 1
+    return h / 3 * math.fsum([2 * sum_even, 4 * sum_odd, -f_a, -f_b])
+
+
+def render_plot(func_str, a, b):
+    user_func = make_user_func(func_str)
+    fig = Figure(figsize=(7, 4.5))
+    ax = fig.subplots()
+
+    # Основна лінія функції
+    x_plot = np.linspace(a - (b - a) * 0.1, b + (b - a) * 0.1, 200)
+    y_plot = evaluate_batch(user_func, x_plot)
+    ax.plot(x_plot, y_plot, label=f'f(x)', color='#2563eb', linewidth=2)
+    ax.axhline(0, color='black', linewidth=0.8)
 
-    return h / 3 * (y[0] + y[-1] + 4 * np.sum(y[1:-1:2]) + 2 * np.sum(y[2:-2:2]))
+    # Зафарбовування області інтегрування
+    x_fill = np.linspace(a, b, 100)
+    y_fill = evaluate_batch(user_func, x_fill)
+    ax.fill_between(x_fill, y_fill, color='skyblue', alpha=0.3)
 
+    ymin_val = min(min(y_fill), 0)
+    ymax_val = max(max(y_fill), 0)
+    ax.vlines([a, b], ymin=ymin_val, ymax=ymax_val, color='gray', linestyle='--', alpha=0.7)
 
-def method_gauss_legendre(func, a, b, n):
+    ax.set_title(f"Графік функції на відрізку [{a}, {b}]")
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
 
-    deg = min(n, 90)
-    x_gauss, w_gauss = np.polynomial.legendre.leggauss(deg)
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=100)
+    return base64.b64encode(buf.getvalue()).decode('utf-8')
 
-    t = 0.5 * (x_gauss + 1) * (b - a) + a
-    return 0.5 * (b - a) * np.sum(w_gauss * func(t))
+
+PLOTS = PlotCache(render_plot, normalize=normalize_expression)
+
+
+@eel.expose
+def get_plot(plot_key):
+    return PLOTS.get(plot_key)
+
+
+def compute_integral(func_str, a, b, n, tol, max_evals):
+    user_func = make_user_func(func_str)
+
+    results, evaluations, eval_path = integrate_on_shared_grid(user_func, a, b, n)
+    gauss_m, gauss_k = gauss_panels(n)
+    results["gauss"] = method_gauss_legendre_composite(user_func, a, b, gauss_m, gauss_k)
+    evaluations += gauss_m * gauss_k
+
+    adaptive, adaptive_error, adaptive_evals, converged = method_adaptive_gauss_kronrod(
+        user_func, a, b, abs_tol=tol, rel_tol=tol, max_evals=max_evals)
+    results["adaptive"] = adaptive
+    evaluations += adaptive_evals
+
+    romberg, romberg_error, romberg_table, romberg_evals, romberg_converged = method_romberg(
+        user_func, a, b, abs_tol=tol, rel_tol=tol, max_evals=max_evals)
+    results["romberg"] = romberg
+    evaluations += romberg_evals
+
+    return {
+        "results": results,
+        "evaluations": evaluations,
+        "adaptive": {"error": adaptive_error, "evaluations": adaptive_evals, "converged": converged},
+        "romberg": {"error": romberg_error, "evaluations": romberg_evals,
+                    "converged": romberg_converged, "table": romberg_table},
+        "eval_path": eval_path,
+    }
+
+
+SCHEDULER = JobScheduler()
+
+
+@eel.expose
+def cancel_job(job_id):
+    SCHEDULER.cancel(job_id)
+
+
+MAX_STUDY_POINTS = 40
+STUDY_METHODS = ["rect_left", "rect_right", "rect_mid", "trapezoid", "simpson", "gauss"]
+
+
+def parse_n_values(n_values_str):
+    # "10, 100, 1000" — список; "10:1000000:10" — геометричний ряд start:stop:множник
+    text = n_values_str.strip()
+    if ":" in text:
+        start, stop, factor = (float(p) for p in text.split(":"))
+        if start < 1 or factor <= 1:
+            raise ValueError("Для ряду потрібно start >= 1 та множник > 1")
+        values = []
+        n = start
+        while n <= stop * (1 + 1e-12) and len(values) <= MAX_STUDY_POINTS:
+            values.append(int(round(n)))
+            n *= factor
+    else:
+        values = [int(float(p)) for p in text.replace(";", ",").split(",") if p.strip()]
+
+    values = sorted(set(values))
+    if not values or values[0] <= 0:
+        raise ValueError("Значення n мають бути > 0")
+    if len(values) > MAX_STUDY_POINTS:
+        raise ValueError(f"Не більше {MAX_STUDY_POINTS} значень n")
+    return values
+
+
+def render_convergence_plot(n_values, errors):
+    fig = Figure(figsize=(7, 4.5))
+    ax = fig.subplots()
+    for method, values in errors.items():
+        # Нульову похибку неможливо показати в логарифмічній шкалі
+        ax.loglog(n_values, [v if v > 0 else np.nan for v in values], marker='o', markersize=3, label=method)
+    ax.set_xlabel("n")
+    ax.set_ylabel("|I_n - I|")
+    ax.set_title("Збіжність методів")
+    ax.legend()
+    ax.grid(True, which='both', alpha=0.3)
+    fig.tight_layout()
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=100)
+    return base64.b64encode(buf.getvalue()).decode('utf-8')
+
+
+def run_convergence_study(func_str, a, b, n_values, report):
+    user_func = make_user_func(func_str)
+    # Еталонне значення — адаптивний Гаусс–Кронрод з жорстким допуском
+    reference, reference_error, _, _ = method_adaptive_gauss_kronrod(
+        user_func, a, b, abs_tol=1e-14, rel_tol=1e-14, max_evals=10 ** 6)
+    report({"n": None, "method": "reference", "value": reference, "error": reference_error})
+
+    errors = {method: [] for method in STUDY_METHODS}
+    evaluations = evaluations_without_reuse = 0
+    previous = None
+    for n in n_values:
+        # Якщо n кратне попередньому, вузли попередньої сітки беруться з уже обчислених сум
+        previous, count, _ = shared_grid_sums(user_func, a, b, n, previous)
+        evaluations += count
+        for method, value in rules_from_sums(previous, a, b).items():
+            errors[method].append(abs(value - reference))
+            report({"n": n, "method": method, "value": value, "error": errors[method][-1]})
+
+        gauss_m, gauss_k = gauss_panels(n)
+        value = method_gauss_legendre_composite(user_func, a, b, gauss_m, gauss_k)
+        evaluations += gauss_m * gauss_k
+        evaluations_without_reuse += 2 * n + 1 + gauss_m * gauss_k
+        errors["gauss"].append(abs(value - reference))
+        report({"n": n, "method": "gauss", "value": value, "error": errors["gauss"][-1]})
+
+    return {
+        "reference": reference,
+        "n_values": n_values,
+        "errors": errors,
+        "evaluations": evaluations,
+        "evaluations_without_reuse": evaluations_without_reuse,
+        "image": render_convergence_plot(n_values, errors),
+    }
 
 
 @eel.expose
-def calculate_integral(func_str, a_str, b_str, n_str):
+def convergence_study(func_str, a_str, b_str, n_values_str, job_id=None):
+    try:
+        a = float(a_str)
+        b = float(b_str)
+        n_values = parse_n_values(n_values_str)
+        make_user_func(func_str)
+        job_id = job_id or os.urandom(8).hex()
+
+        # Проміжні результати надсилаються в браузер одразу, як тільки їх порахував процес
+        def on_progress(item):
+            item["job_id"] = job_id
+            eel.convergence_update(item)
+
+        ok, response = SCHEDULER.run(job_id, run_convergence_study, func_str, a, b, n_values,
+                                     on_progress=on_progress)
+        if not ok:
+            return {"error": response, "image": None}
+        response["error"] = None
+        return response
+    except Exception as e:
+        return {"error": str(e), "image": None}
+
+
+# Верхня межа бюджету обчислень f для адаптивного методу та Ромберга
+MAX_EVALS = 10 ** 7
+
+
+@eel.expose
+def calculate_integral(func_str, a_str, b_str, n_str, tol_str="1e-10", max_evals_str="100000", job_id=None):
     try:
         a = float(a_str)
         b = float(b_str)
         n = int(n_str)
+        tol = float(tol_str)
+        # Бюджет приходить з браузера, тому обмежується на боці сервера
+        max_evals = min(int(max_evals_str), MAX_EVALS)
 
         if n <= 0: return {"error": "Кількість кроків має бути > 0"}
 
-        math_context = get_safe_math_context()
-
-        def user_func(x):
-            local_context = math_context.copy()
-            local_context['x'] = x
-            return eval(func_str, {"__builtins__": {}}, local_context)
-
-        results = {
-            "rect_left": method_rectangle_left(user_func, a, b, n),
-            "rect_right": method_rectangle_right(user_func, a, b, n),
-            "rect_mid": method_rectangle_middle(user_func, a, b, n),
-            "trapezoid": method_trapezoidal(user_func, a, b, n),
-            "simpson": method_simpson(user_func, a, b, n),
-            "gauss": method_gauss_legendre(user_func, a, b, n)
-        }
-
-        # 2. Побудова графіка
-        plt.figure(figsize=(7, 4.5))
-
-        # Основна лінія функції
-        x_plot = np.linspace(a - (b - a) * 0.1, b + (b - a) * 0.1, 200)
-        y_plot = user_func(x_plot)
-        plt.plot(x_plot, y_plot, label=f'f(x)', color='#2563eb', linewidth=2)
-        plt.axhline(0, color='black', linewidth=0.8)
-
-        # Зафарбовування області інтегрування
-        x_fill = np.linspace(a, b, 100)
-        y_fill = user_func(x_fill)
-        plt.fill_between(x_fill, y_fill, color='skyblue', alpha=0.3)
-
-        ymin_val = min(min(y_fill), 0)
-        ymax_val = max(max(y_fill), 0)
-        plt.vlines([a, b], ymin=ymin_val, ymax=ymax_val, color='gray', linestyle='--', alpha=0.7)
-
-        plt.title(f"Графік функції на відрізку [{a}, {b}]")
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', dpi=100)
-        buf.seek(0)
-        img_str = base64.b64encode(buf.read()).decode('utf-8')
-        plt.close()
-
-        return {
-            "results": results,
-            "image": img_str,
-            "error": None
-        }
+        # Помилки у виразі повертаються одразу, без запуску процесу
+        make_user_func(func_str)
+
+        # 1. Чисельна частина виконується планувальником в окремому процесі
+        ok, response = SCHEDULER.run(job_id or os.urandom(8).hex(), compute_integral,
+                                     func_str, a, b, n, tol, max_evals)
+        if not ok:
+            return {"error": response, "results": None, "plot_key": None}
+
+        # 2. Графік будується у фоновому процесі; браузер забирає його окремим викликом get_plot
+        response["plot_key"] = PLOTS.request(func_str, a, b)
+        response["error"] = None
+        return response
     except Exception as e:
-        return {"error": str(e), "results": None, "image": None}
+        return {"error": str(e), "results": None, "plot_key": None}
 
 
 if __name__ == "__main__":
+    if len(GAUSS_NODES_CACHE) < MAX_GAUSS_DEG:
+        precompute_gauss_nodes()
 
+    # Процеси обчислень запускаються разом із застосунком, а не на першому запиті
+    SCHEDULER.start()
     eel.start('index.html', size=(950, 800), mode='default')
\ No newline at end of file
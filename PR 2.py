@@ -1,13 +1,457 @@
-import tkinter as tk
-from tkinter import ttk, messagebox
 import math
+from array import array
 
 try:
     import numpy as np
 except:
     np = None
 
-def jacobi_method(A, b, x0=None, eps=1e-3, max_iter=10000):
+# Розв'язувачі використовуються і без графічного інтерфейсу (batch_solve.py на сервері без Tk)
+try:
+    import tkinter as tk
+    from tkinter import ttk, messagebox
+except ImportError:
+    tk = None
+
+
+class CSRMatrix:
+    # Компактне зберігання розрідженої матриці: лише ненульові елементи по рядках
+    def __init__(self, data, indices, indptr, shape):
+        self.data = np.asarray(data, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.shape = tuple(shape)
+        # Номер рядка кожного елемента — для множення на вектор через bincount
+        self.rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+
+    @classmethod
+    def from_coo(cls, rows, cols, vals, shape):
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        vals = np.asarray(vals, dtype=float)
+        order = np.lexsort((cols, rows))
+        rows, cols, vals = rows[order], cols[order], vals[order]
+        # Повторні (i, j) сумуються, як у форматі COO
+        keep = np.ones(len(rows), dtype=bool)
+        keep[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+        starts = np.flatnonzero(keep)
+        vals = np.add.reduceat(vals, starts) if len(vals) else vals
+        rows, cols = rows[starts], cols[starts]
+        indptr = np.zeros(shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=shape[0]), out=indptr[1:])
+        return cls(vals, cols, indptr, shape)
+
+    @classmethod
+    def from_dense(cls, A):
+        A = np.asarray(A, dtype=float)
+        rows, cols = np.nonzero(A)
+        return cls.from_coo(rows, cols, A[rows, cols], A.shape)
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    @property
+    def nbytes(self):
+        return self.data.nbytes + self.indices.nbytes + self.indptr.nbytes + self.rows.nbytes
+
+    def dot(self, x):
+        if x.ndim == 2:
+            # Кілька векторів-стовпців за один прохід: суми по відрізках рядків CSR.
+            # Порожні рядки пропускаються, інакше reduceat узяв би для них чужий елемент.
+            out = np.zeros((self.shape[0], x.shape[1]))
+            nonempty = np.flatnonzero(np.diff(self.indptr))
+            if len(nonempty):
+                products = np.take(x, self.indices, axis=0)
+                products *= self.data[:, None]
+                out[nonempty] = np.add.reduceat(products, self.indptr[nonempty], axis=0)
+            return out
+        return np.bincount(self.rows, weights=self.data * x[self.indices], minlength=self.shape[0])
+
+    def diagonal(self):
+        D = np.zeros(self.shape[0])
+        on_diag = self.rows == self.indices
+        D[self.rows[on_diag]] = self.data[on_diag]
+        return D
+
+    def take_rows(self, idx):
+        # Підматриця з рядків idx без циклу по рядках
+        starts = self.indptr[idx]
+        lengths = self.indptr[idx + 1] - starts
+        offsets = np.cumsum(lengths) - lengths
+        take = np.arange(lengths.sum()) - np.repeat(offsets, lengths) + np.repeat(starts, lengths)
+        indptr = np.concatenate([[0], np.cumsum(lengths)])
+        return CSRMatrix(self.data[take], self.indices[take], indptr, (len(idx), self.shape[1]))
+
+    def toarray(self):
+        A = np.zeros(self.shape)
+        A[self.rows, self.indices] = self.data
+        return A
+
+
+def is_sparse(A):
+    # CSRMatrix або будь-яка матриця scipy.sparse (csr, coo, ...)
+    return isinstance(A, CSRMatrix) or hasattr(A, 'tocsr')
+
+
+def as_csr(A):
+    if isinstance(A, CSRMatrix):
+        return A
+    if hasattr(A, 'tocsr'):
+        m = A.tocsr(copy=True)
+        m.sum_duplicates()
+        m.eliminate_zeros()
+        return CSRMatrix(m.data, m.indices, m.indptr, m.shape)
+    return CSRMatrix.from_dense(A)
+
+
+def matrix_nbytes(A):
+    if is_sparse(A):
+        return as_csr(A).nbytes
+    if np is not None:
+        return np.asarray(A, dtype=float).nbytes
+    return 8 * len(A) * len(A)
+
+
+def per_row(v, b):
+    # Діагональ як стовпець, якщо b — матриця n x k з кількома правими частинами
+    return v[:, None] if b.ndim == 2 else v
+
+
+def residual_norm(A, x, b):
+    # Для n x k — норма нев'язки кожного стовпця
+    return np.linalg.norm(A.dot(x) - b, axis=0)
+
+
+DIVERGENCE_GROWTH = 1e4
+STAGNATION_WINDOW = 50
+
+
+class ConvergenceMonitor:
+    # Історія норми поправки ||x_k - x_(k-1)||_inf (для Якобі це нев'язка, поділена на діагональ)
+    # і раннє переривання: розбіжність — поправка стала inf/nan або ціле вікно ітерацій поспіль
+    # більша за найменшу в DIVERGENCE_GROWTH разів (короткочасне зростання — звичайна річ для
+    # ненормальних матриць ітерацій, напр. трикутних); застій — за останнє вікно ітерацій
+    # поправка не зменшилась або з поточною швидкістю eps не буде досягнуто до max_iter
+    def __init__(self, eps, max_iter, detect=True):
+        self.eps = eps
+        self.max_iter = max_iter
+        self.detect = detect
+        self.history = array('d')
+        self.best = math.inf
+        self.growing = 0
+        self.status = None
+        self.spectral_radius = None
+
+    def update(self, delta):
+        # True — ітерації слід припинити
+        delta = float(delta)
+        self.history.append(delta)
+        k = len(self.history)
+        if delta < self.eps:
+            self.status = 'converged'
+            return False
+        if not self.detect:
+            return False
+        if not math.isfinite(delta):
+            self.status = 'diverged'
+            return True
+        self.growing = self.growing + 1 if delta > DIVERGENCE_GROWTH * self.best else 0
+        if self.growing >= STAGNATION_WINDOW:
+            self.status = 'diverged'
+            return True
+        self.best = min(self.best, delta)
+        if k >= 2 * STAGNATION_WINDOW and k % STAGNATION_WINDOW == 0:
+            old = self.history[k - 1 - STAGNATION_WINDOW]
+            if delta >= old:
+                self.status = 'stagnated'
+                return True
+            # Швидкість на початку часто нехарактерна, тож прогноз — лише після 10% ліміту
+            rate = (delta / old) ** (1 / STAGNATION_WINDOW)
+            if k >= self.max_iter // 10 and k + math.log(self.eps / delta) / math.log(rate) > self.max_iter:
+                self.status = 'stagnated'
+                return True
+        return False
+
+    def finish(self):
+        if self.status is None:
+            self.status = 'max_iter'
+        return self
+
+
+def max_change(x, x_old):
+    # Вбудований max пропускає nan (порівняння з nan завжди хибне), і розбіжні ітерації
+    # виглядали б збіжними, тому nan повертається одразу
+    delta = 0.0
+    for new, old in zip(x, x_old):
+        d = abs(new - old)
+        if d != d:
+            return d
+        delta = max(delta, d)
+    return delta
+
+
+def should_stop(monitor, delta, eps):
+    # Поправка inf/nan — ітерації розбіглися, далі рахувати немає сенсу й без монітора
+    if monitor is not None and monitor.update(delta):
+        return True
+    return delta < eps or not math.isfinite(delta)
+
+
+def jacobi_sparse(A, b, x0=None, eps=1e-3, max_iter=10000, monitor=None):
+    # Одна ітерація — одне множення CSR на вектор, тобто O(nnz)
+    A = as_csr(A)
+    b = np.array(b, dtype=float)
+    x = b.copy() if x0 is None else np.array(x0, dtype=float)
+    D = A.diagonal()
+    if np.any(D == 0):
+        raise ValueError("Діагональний елемент 0")
+    D = per_row(D, b)
+    for k in range(1, max_iter + 1):
+        # (b - R x) / D = x + (b - A x) / D, тож окрема матриця R не потрібна
+        x_new = x + (b - A.dot(x)) / D
+        delta = np.max(np.abs(x_new - x))
+        if should_stop(monitor, delta, eps):
+            return x_new, k, residual_norm(A, x_new, b)
+        x = x_new
+    return x, max_iter, residual_norm(A, x, b)
+
+
+def sor_sparse(A, b, x0=None, eps=1e-3, max_iter=10000, omega=1.0, symmetric=False, monitor=None):
+    # Послідовний прохід по рядках CSR: кожен ненульовий елемент використовується один раз.
+    # symmetric=True — SSOR: після прямого проходу рядки обходяться у зворотному порядку.
+    A = as_csr(A)
+    n = A.shape[0]
+    D = A.diagonal()
+    if np.any(D == 0):
+        raise ValueError("Діагональний елемент 0")
+    order = list(range(n)) + (list(range(n - 1, -1, -1)) if symmetric else [])
+    if np.ndim(b) == 2:
+        # Кілька правих частин: x[i] — рядок довжини k, тож кожен елемент A читається
+        # один раз за прохід для всіх правих частин
+        b = np.array(b, dtype=float)
+        x = b.copy() if x0 is None else np.array(x0, dtype=float)
+        off_diag = []
+        for i in range(n):
+            cols = A.indices[A.indptr[i]:A.indptr[i + 1]]
+            keep = cols != i
+            off_diag.append((cols[keep], A.data[A.indptr[i]:A.indptr[i + 1]][keep]))
+        for k in range(1, max_iter + 1):
+            x_old = x.copy()
+            for i in order:
+                cols, vals = off_diag[i]
+                x[i] += omega * ((b[i] - vals.dot(x[cols])) / D[i] - x[i])
+            delta = np.max(np.abs(x - x_old))
+            if should_stop(monitor, delta, eps):
+                break
+        else:
+            k = max_iter
+        return x, k, residual_norm(A, x, b)
+    data, indices, indptr = A.data.tolist(), A.indices.tolist(), A.indptr.tolist()
+    diag, rhs = D.tolist(), np.asarray(b, dtype=float).tolist()
+    x = list(rhs) if x0 is None else [float(v) for v in x0]
+    for k in range(1, max_iter + 1):
+        x_old = list(x)
+        for i in order:
+            s = 0.0
+            for p in range(indptr[i], indptr[i + 1]):
+                j = indices[p]
+                if j != i:
+                    s += data[p] * x[j]
+            x[i] += omega * ((rhs[i] - s) / diag[i] - x[i])
+        delta = max_change(x, x_old)
+        if should_stop(monitor, delta, eps):
+            break
+    else:
+        k = max_iter
+    x = np.array(x)
+    return x, k, np.linalg.norm(A.dot(x) - np.asarray(b, dtype=float))
+
+
+def gauss_seidel_sparse(A, b, x0=None, eps=1e-3, max_iter=10000, monitor=None):
+    return sor_sparse(A, b, x0=x0, eps=eps, max_iter=max_iter, monitor=monitor)
+
+
+def multicolor_ordering(A):
+    # Жадібне розфарбування графа матриці: рядки одного кольору не пов'язані між собою,
+    # тож у проході Зейделя їх можна оновити одночасно
+    A = as_csr(A)
+    n = A.shape[0]
+    off = A.rows != A.indices
+    rows = np.concatenate([A.rows[off], A.indices[off]])
+    cols = np.concatenate([A.indices[off], A.rows[off]])
+    graph = CSRMatrix.from_coo(rows, cols, np.ones(len(rows)), A.shape)
+    indptr, indices = graph.indptr.tolist(), graph.indices.tolist()
+    colors = [0] * n
+    for i in range(n):
+        used = {colors[j] for j in indices[indptr[i]:indptr[i + 1]] if j < i}
+        c = 0
+        while c in used:
+            c += 1
+        colors[i] = c
+    colors = np.array(colors)
+    return [np.flatnonzero(colors == c) for c in range(colors.max() + 1)]
+
+
+def sor_multicolor(A, b, x0=None, eps=1e-3, max_iter=10000, omega=1.0, symmetric=False, monitor=None):
+    # Зейдель/SOR у багатокольоровому порядку: кожен клас кольору — одна векторна операція.
+    # symmetric=True — SSOR: після прямого проходу класи оновлюються у зворотному порядку.
+    A = as_csr(A)
+    b = np.array(b, dtype=float)
+    x = b.copy() if x0 is None else np.array(x0, dtype=float)
+    D = A.diagonal()
+    if np.any(D == 0):
+        raise ValueError("Діагональний елемент 0")
+    classes = [(idx, A.take_rows(idx), per_row(D[idx], b), b[idx]) for idx in multicolor_ordering(A)]
+    if symmetric:
+        classes = classes + classes[::-1]
+    for k in range(1, max_iter + 1):
+        x_old = x.copy() if symmetric else None
+        delta = 0.0
+        for idx, A_c, D_c, b_c in classes:
+            step = omega * (b_c - A_c.dot(x)) / D_c
+            x[idx] += step
+            delta = np.maximum(delta, np.max(np.abs(step)))
+        if symmetric:
+            delta = np.max(np.abs(x - x_old))
+        if should_stop(monitor, delta, eps):
+            return x, k, residual_norm(A, x, b)
+    return x, max_iter, residual_norm(A, x, b)
+
+
+def gauss_seidel_multicolor(A, b, x0=None, eps=1e-3, max_iter=10000, monitor=None):
+    return sor_multicolor(A, b, x0=x0, eps=eps, max_iter=max_iter, monitor=monitor)
+
+
+GS_BLOCK = 64
+
+
+def sor_blocked(A, b, x0=None, eps=1e-3, max_iter=10000, omega=1.0, symmetric=False, monitor=None):
+    # Щільна матриця: прохід блоками рядків. Зв'язки поза блоком — два множення матриці
+    # на вектор, усередині блоку — множення на заздалегідь обернену трикутну частину
+    # M = D/omega + L. Ітерації збігаються з поелементним Зейделем/SOR.
+    # symmetric=True — SSOR: зворотний прохід з M = D/omega + U.
+    A = np.array(A, dtype=float)
+    b = np.array(b, dtype=float)
+    n = A.shape[0]
+    x = b.copy() if x0 is None else np.array(x0, dtype=float)
+    if np.any(np.diag(A) == 0):
+        raise ValueError("Діагональний елемент 0")
+
+    def make_blocks(triangle):
+        blocks = []
+        for s in range(0, n, GS_BLOCK):
+            e = min(s + GS_BLOCK, n)
+            block = A[s:e, s:e]
+            M = triangle(block, -1 if triangle is np.tril else 1) + np.diag(np.diag(block) / omega)
+            blocks.append((s, e, np.linalg.inv(M), block - M))
+        return blocks
+
+    sweeps = [make_blocks(np.tril)]
+    if symmetric:
+        sweeps.append(make_blocks(np.triu)[::-1])
+    for k in range(1, max_iter + 1):
+        delta = 0.0
+        for blocks in sweeps:
+            for s, e, M_inv, rest in blocks:
+                r = b[s:e] - A[s:e, :s].dot(x[:s]) - A[s:e, e:].dot(x[e:]) - rest.dot(x[s:e])
+                x_block = M_inv.dot(r)
+                delta = np.maximum(delta, np.max(np.abs(x_block - x[s:e])))
+                x[s:e] = x_block
+        if should_stop(monitor, delta, eps):
+            return x, k, residual_norm(A, x, b)
+    return x, max_iter, residual_norm(A, x, b)
+
+
+def gauss_seidel_blocked(A, b, x0=None, eps=1e-3, max_iter=10000, monitor=None):
+    return sor_blocked(A, b, x0=x0, eps=eps, max_iter=max_iter, monitor=monitor)
+
+
+def jacobi_spectral_radius(A, iters=30):
+    # Степеневий метод для матриці Якобі G = I - D^-1 A. Власні числа G часто йдуть парами ±rho,
+    # тому норма оцінюється за два кроки.
+    A = as_csr(A) if is_sparse(A) else np.array(A, dtype=float)
+    D = A.diagonal()
+    if np.any(D == 0):
+        raise ValueError("Діагональний елемент 0")
+    v = np.random.default_rng(0).random(A.shape[0]) + 0.5
+    rho = 0.0
+    for _ in range(iters):
+        norm = np.linalg.norm(v)
+        if norm == 0:
+            return 0.0
+        v = v / norm
+        for _ in range(2):
+            v = v - A.dot(v) / D
+        rho = np.sqrt(np.linalg.norm(v))
+    return float(rho)
+
+
+def optimal_sor_omega(A, symmetric=False, ordering=None, probe_iters=15):
+    # omega = 2 / (1 + sqrt(1 - rho_J^2)) — оптимум лише для узгоджено впорядкованих матриць.
+    # Для інших матриць (напр. щільних) він буває гіршим за Зейделя, тому швидкість спадання
+    # поправки при цьому omega порівнюється зі швидкістю Зейделя (omega = 1) коротким
+    # степеневим методом, і береться швидший варіант
+    rho = jacobi_spectral_radius(A)
+    if rho >= 1:
+        return 1.0
+    omega = float(min(2 / (1 + np.sqrt(1 - rho * rho)), 1.95))
+    rate_sor = iteration_spectral_radius(sor_method, A, iters=probe_iters, omega=omega,
+                                         symmetric=symmetric, ordering=ordering)
+    rate_gs = iteration_spectral_radius(sor_method, A, iters=probe_iters, omega=1.0,
+                                        symmetric=symmetric, ordering=ordering)
+    return omega if rate_sor < rate_gs else 1.0
+
+
+def sor_method(A, b, x0=None, eps=1e-3, max_iter=10000, omega=None, symmetric=False, ordering=None,
+               monitor=None):
+    if omega is None:
+        omega = optimal_sor_omega(A, symmetric=symmetric, ordering=ordering)
+    if not 0 < omega < 2:
+        raise ValueError("Параметр релаксації omega має бути в (0, 2)")
+    if is_sparse(A):
+        # Для SSOR багатокольоровий порядок не дає прискорення, тому за замовчуванням — природний
+        ordering = ordering or ('natural' if symmetric else 'multicolor')
+        solver = sor_sparse if ordering == 'natural' else sor_multicolor
+        return solver(A, b, x0=x0, eps=eps, max_iter=max_iter, omega=omega, symmetric=symmetric, monitor=monitor)
+    return sor_blocked(A, b, x0=x0, eps=eps, max_iter=max_iter, omega=omega, symmetric=symmetric, monitor=monitor)
+
+
+def ssor_method(A, b, x0=None, eps=1e-3, max_iter=10000, omega=None, ordering=None):
+    return sor_method(A, b, x0=x0, eps=eps, max_iter=max_iter, omega=omega, symmetric=True, ordering=ordering)
+
+
+def iteration_spectral_radius(solver, A, iters=30, **options):
+    # Степеневий метод для матриці ітерацій G самого методу: при b = 0 кожна ітерація
+    # множить x на G, тож поправки спадають (або ростуть) як rho^k. Вистачає одного запуску
+    # на iters ітерацій з тією ж підготовкою, що й у справжньому розв'язанні.
+    n = A.shape[0] if hasattr(A, 'shape') else len(A)
+    v = [1.0 + (0.618 * i) % 1.0 for i in range(n)]
+    monitor = ConvergenceMonitor(eps=0.0, max_iter=iters, detect=False)
+    solver(A, [0.0] * n, x0=v, eps=0.0, max_iter=iters, monitor=monitor, **options)
+    h = monitor.history
+    skip = len(h) // 3
+    if len(h) - skip < 2 or h[-1] == 0 or h[skip] == 0:
+        return 0.0
+    return (h[-1] / h[skip]) ** (1 / (len(h) - 1 - skip))
+
+
+def solve_with_diagnostics(solver, A, b, x0=None, eps=1e-3, max_iter=10000, **options):
+    # Оцінка спектрального радіуса лише показується: за 30 ітерацій ненормальна матриця ітерацій
+    # (напр. I + 1.5 * eye(n, k=1)) може давати велике короткочасне зростання при rho = 0.
+    # Розбіжність визначає монітор за стійким зростанням поправки під час самих ітерацій.
+    # Повертає (x, k, rnorm, monitor): monitor.status, monitor.spectral_radius, monitor.history.
+    monitor = ConvergenceMonitor(eps, max_iter)
+    monitor.spectral_radius = iteration_spectral_radius(solver, A, **options)
+    x, k, rnorm = solver(A, b, x0=x0, eps=eps, max_iter=max_iter, monitor=monitor, **options)
+    return x, k, rnorm, monitor.finish()
+
+
+def jacobi_method(A, b, x0=None, eps=1e-3, max_iter=10000, monitor=None, diagnostics=False):
+    if diagnostics:
+        return solve_with_diagnostics(jacobi_method, A, b, x0=x0, eps=eps, max_iter=max_iter)
+    if np is not None and is_sparse(A):
+        return jacobi_sparse(A, b, x0=x0, eps=eps, max_iter=max_iter, monitor=monitor)
     if np is not None:
         A = np.array(A, dtype=float)
         b = np.array(b, dtype=float)
@@ -17,14 +461,14 @@ def jacobi_method(A, b, x0=None, eps=1e-3, max_iter=10000):
         if np.any(D == 0):
             raise ValueError("Діагональний елемент 0")
         R = A - np.diagflat(D)
+        D = per_row(D, b)
         for k in range(1, max_iter + 1):
             x_new = (b - R.dot(x)) / D
-            if np.max(np.abs(x_new - x)) < eps:
-                r = A.dot(x_new) - b
-                return x_new, k, np.linalg.norm(r)
+            delta = np.max(np.abs(x_new - x))
+            if should_stop(monitor, delta, eps):
+                return x_new, k, residual_norm(A, x_new, b)
             x = x_new
-        r = A.dot(x) - b
-        return x, max_iter, np.linalg.norm(r)
+        return x, max_iter, residual_norm(A, x, b)
     else:
         n = len(A)
         x = b[:] if x0 is None else x0[:]
@@ -36,7 +480,8 @@ def jacobi_method(A, b, x0=None, eps=1e-3, max_iter=10000):
                     raise ValueError("Діагональний елемент 0")
                 s = sum(A[i][j] * x[j] for j in range(n) if j != i)
                 x_new[i] = (b[i] - s) / A[i][i]
-            if max(abs(x_new[i] - x[i]) for i in range(n)) < eps:
+            delta = max_change(x_new, x)
+            if should_stop(monitor, delta, eps):
                 r = [sum(A[i][j] * x_new[j] for j in range(n)) - b[i] for i in range(n)]
                 rnorm = math.sqrt(sum(rr * rr for rr in r))
                 return x_new, k, rnorm
@@ -46,26 +491,16 @@ def jacobi_method(A, b, x0=None, eps=1e-3, max_iter=10000):
         return x, max_iter, rnorm
 
 
-def gauss_seidel(A, b, x0=None, eps=1e-3, max_iter=10000):
+def gauss_seidel(A, b, x0=None, eps=1e-3, max_iter=10000, ordering='multicolor', monitor=None,
+                 diagnostics=False):
+    if diagnostics:
+        return solve_with_diagnostics(gauss_seidel, A, b, x0=x0, eps=eps, max_iter=max_iter, ordering=ordering)
+    if np is not None and is_sparse(A):
+        if ordering == 'natural':
+            return gauss_seidel_sparse(A, b, x0=x0, eps=eps, max_iter=max_iter, monitor=monitor)
+        return gauss_seidel_multicolor(A, b, x0=x0, eps=eps, max_iter=max_iter, monitor=monitor)
     if np is not None:
-        A = np.array(A, dtype=float)
-        b = np.array(b, dtype=float)
-        n = A.shape[0]
-        x = b.copy() if x0 is None else np.array(x0, dtype=float)
-        for k in range(1, max_iter + 1):
-            x_new = x.copy()
-            for i in range(n):
-                s1 = A[i, :i].dot(x_new[:i])
-                s2 = A[i, i + 1:].dot(x[i + 1:])
-                if A[i, i] == 0:
-                    raise ValueError("Діагональний елемент 0")
-                x_new[i] = (b[i] - s1 - s2) / A[i, i]
-            if np.max(np.abs(x_new - x)) < eps:
-                r = A.dot(x_new) - b
-                return x_new, k, np.linalg.norm(r)
-            x = x_new
-        r = A.dot(x) - b
-        return x, max_iter, np.linalg.norm(r)
+        return gauss_seidel_blocked(A, b, x0=x0, eps=eps, max_iter=max_iter, monitor=monitor)
     else:
         n = len(A)
         x = b[:] if x0 is None else x0[:]
@@ -77,7 +512,8 @@ def gauss_seidel(A, b, x0=None, eps=1e-3, max_iter=10000):
                 if A[i][i] == 0:
                     raise ValueError("Діагональний елемент 0")
                 x[i] = (b[i] - s) / A[i][i]
-            if max(abs(x[i] - x_old[i]) for i in range(n)) < eps:
+            delta = max_change(x, x_old)
+            if should_stop(monitor, delta, eps):
                 r = [sum(A[i][j] * x[j] for j in range(n)) - b[i] for i in range(n)]
                 rnorm = math.sqrt(sum(rr * rr for rr in r))
                 return x, k, rnorm
@@ -86,7 +522,287 @@ def gauss_seidel(A, b, x0=None, eps=1e-3, max_iter=10000):
         return x, max_iter, rnorm
 
 
-class SLRApp(tk.Tk):
+def _as_operator(A):
+    return as_csr(A) if is_sparse(A) else np.array(A, dtype=float)
+
+
+def jacobi_preconditioner(A):
+    D = _as_operator(A).diagonal()
+    if np.any(D == 0):
+        raise ValueError("Діагональний елемент 0")
+    return lambda r: r / D
+
+
+def _level_schedule(T, lower):
+    # Рядки одного рівня залежать лише від попередніх рівнів, тож розв'язуються разом
+    n = T.shape[0]
+    indptr, indices = T.indptr.tolist(), T.indices.tolist()
+    level = [0] * n
+    for i in (range(n) if lower else range(n - 1, -1, -1)):
+        deps = [level[j] for j in indices[indptr[i]:indptr[i + 1]]]
+        level[i] = 1 + max(deps) if deps else 0
+    level = np.array(level)
+    return [np.flatnonzero(level == lv) for lv in range(level.max() + 1)]
+
+
+def ilu0_preconditioner(A):
+    # Неповна LU-факторизація без заповнення: L і U мають той самий шаблон ненулів, що й A
+    A = as_csr(A)
+    n = A.shape[0]
+    data = A.data.copy()
+    indices, indptr = A.indices.tolist(), A.indptr.tolist()
+    diag_pos = [-1] * n
+    for i in range(n):
+        for p in range(indptr[i], indptr[i + 1]):
+            if indices[p] == i:
+                diag_pos[i] = p
+    if min(diag_pos) < 0:
+        raise ValueError("Діагональний елемент 0")
+    for i in range(n):
+        row = {indices[p]: p for p in range(indptr[i], indptr[i + 1])}
+        for p in range(indptr[i], diag_pos[i]):
+            k = indices[p]
+            data[p] /= data[diag_pos[k]]
+            for q in range(diag_pos[k] + 1, indptr[k + 1]):
+                if indices[q] in row:
+                    data[row[indices[q]]] -= data[p] * data[q]
+        if data[diag_pos[i]] == 0:
+            raise ValueError("Нульовий ведучий елемент в ILU(0)")
+
+    factors = CSRMatrix(data, A.indices, A.indptr, A.shape)
+    D = factors.diagonal()
+    lower = factors.rows > factors.indices
+    upper = factors.rows < factors.indices
+    L = CSRMatrix.from_coo(factors.rows[lower], factors.indices[lower], factors.data[lower], A.shape)
+    U = CSRMatrix.from_coo(factors.rows[upper], factors.indices[upper], factors.data[upper], A.shape)
+    lower_levels = _level_schedule(L, lower=True)
+    upper_levels = _level_schedule(U, lower=False)
+
+    # Якщо рівнів мало, кожен рівень — одна векторна операція; якщо залежності йдуть
+    # довгим ланцюжком (рівнів порядку n), швидший звичайний прохід по рядках
+    if (len(lower_levels) + len(upper_levels)) * 32 <= n:
+        lower_steps = [(idx, L.take_rows(idx)) for idx in lower_levels]
+        upper_steps = [(idx, U.take_rows(idx)) for idx in upper_levels]
+
+        def apply(r):
+            # L y = r (одинична діагональ), потім U z = y
+            y = np.zeros(n)
+            for idx, L_rows in lower_steps:
+                y[idx] = r[idx] - L_rows.dot(y)
+            z = np.zeros(n)
+            for idx, U_rows in upper_steps:
+                z[idx] = (y[idx] - U_rows.dot(z)) / D[idx]
+            return z
+
+        return apply
+
+    L_data, L_indices, L_indptr = L.data.tolist(), L.indices.tolist(), L.indptr.tolist()
+    U_data, U_indices, U_indptr = U.data.tolist(), U.indices.tolist(), U.indptr.tolist()
+    diag = D.tolist()
+
+    def apply(r):
+        y = r.tolist()
+        for i in range(n):
+            s = y[i]
+            for p in range(L_indptr[i], L_indptr[i + 1]):
+                s -= L_data[p] * y[L_indices[p]]
+            y[i] = s
+        for i in range(n - 1, -1, -1):
+            s = y[i]
+            for p in range(U_indptr[i], U_indptr[i + 1]):
+                s -= U_data[p] * y[U_indices[p]]
+            y[i] = s / diag[i]
+        return np.array(y)
+
+    return apply
+
+
+PRECONDITIONERS = {
+    'jacobi': jacobi_preconditioner,
+    'ilu0': ilu0_preconditioner,
+}
+
+
+def make_preconditioner(A, preconditioner):
+    # None — без передобумовлення, рядок — вбудований, функція r -> M^-1 r — власний
+    if preconditioner is None or preconditioner == 'none':
+        return lambda r: r
+    if callable(preconditioner):
+        return preconditioner
+    return PRECONDITIONERS[preconditioner](A)
+
+
+def _krylov_setup(A, b, x0):
+    if np is None:
+        raise ValueError("Методи Крилова потребують numpy")
+    A = _as_operator(A)
+    b = np.array(b, dtype=float)
+    x = np.zeros_like(b) if x0 is None else np.array(x0, dtype=float)
+    return A, b, x
+
+
+def krylov_columns(solver, A, B, x0=None, preconditioner=None, **options):
+    # Кілька правих частин: скаляри методу Крилова свої для кожного стовпця, тож стовпці
+    # розв'язуються по черзі, але матриця і передобумовлювач (напр. ILU(0)) готуються один раз
+    A, B, X = _krylov_setup(A, B, x0)
+    M = make_preconditioner(A, preconditioner)
+    iters = 0
+    rnorm = np.zeros(B.shape[1])
+    for j in range(B.shape[1]):
+        X[:, j], k, rnorm[j] = solver(A, B[:, j], x0=X[:, j], preconditioner=M, **options)
+        iters = max(iters, k)
+    return X, iters, rnorm
+
+
+def cg_method(A, b, x0=None, eps=1e-3, max_iter=10000, preconditioner=None):
+    # Метод спряжених градієнтів для симетричних додатно визначених матриць.
+    # Зупинка за відносною нев'язкою ||r|| <= eps * ||b||.
+    if np.ndim(b) == 2:
+        return krylov_columns(cg_method, A, b, x0, preconditioner, eps=eps, max_iter=max_iter)
+    A, b, x = _krylov_setup(A, b, x0)
+    M = make_preconditioner(A, preconditioner)
+    tol = eps * (np.linalg.norm(b) or 1.0)
+    r = b - A.dot(x)
+    if np.linalg.norm(r) <= tol:
+        return x, 0, np.linalg.norm(r)
+    z = M(r)
+    p = z.copy()
+    rz = r.dot(z)
+    for k in range(1, max_iter + 1):
+        Ap = A.dot(p)
+        pAp = p.dot(Ap)
+        if pAp == 0:
+            # Нев'язка ще не нульова, а крок не визначений — матриця не додатно визначена
+            raise ValueError("Зрив методу CG: p·Ap = 0, матриця не додатно визначена")
+        alpha = rz / pAp
+        x += alpha * p
+        r -= alpha * Ap
+        if np.linalg.norm(r) <= tol:
+            return x, k, np.linalg.norm(A.dot(x) - b)
+        z = M(r)
+        rz_new = r.dot(z)
+        p = z + (rz_new / rz) * p
+        rz = rz_new
+    return x, max_iter, np.linalg.norm(A.dot(x) - b)
+
+
+def bicgstab_method(A, b, x0=None, eps=1e-3, max_iter=10000, preconditioner=None):
+    # BiCGSTAB з правим передобумовленням для несиметричних матриць
+    if np.ndim(b) == 2:
+        return krylov_columns(bicgstab_method, A, b, x0, preconditioner, eps=eps, max_iter=max_iter)
+    A, b, x = _krylov_setup(A, b, x0)
+    M = make_preconditioner(A, preconditioner)
+    tol = eps * (np.linalg.norm(b) or 1.0)
+    r = b - A.dot(x)
+    if np.linalg.norm(r) <= tol:
+        return x, 0, np.linalg.norm(r)
+    r_hat = r.copy()
+    rho = alpha = omega = 1.0
+    v = np.zeros_like(b)
+    p = np.zeros_like(b)
+    for k in range(1, max_iter + 1):
+        rho_new = r_hat.dot(r)
+        if rho_new == 0:
+            raise ValueError("Зрив методу BiCGSTAB: r̂·r = 0")
+        p = r + (rho_new / rho) * (alpha / omega) * (p - omega * v)
+        p_hat = M(p)
+        v = A.dot(p_hat)
+        r_hat_v = r_hat.dot(v)
+        if r_hat_v == 0:
+            raise ValueError("Зрив методу BiCGSTAB: r̂·v = 0")
+        alpha = rho_new / r_hat_v
+        s = r - alpha * v
+        if np.linalg.norm(s) <= tol:
+            x += alpha * p_hat
+            return x, k, np.linalg.norm(A.dot(x) - b)
+        s_hat = M(s)
+        t = A.dot(s_hat)
+        tt = t.dot(t)
+        if tt == 0:
+            raise ValueError("Зрив методу BiCGSTAB: t·t = 0, матриця вироджена")
+        omega = t.dot(s) / tt
+        if omega == 0:
+            # Наступний крок ділить на omega
+            raise ValueError("Зрив методу BiCGSTAB: omega = 0")
+        x += alpha * p_hat + omega * s_hat
+        r = s - omega * t
+        if np.linalg.norm(r) <= tol:
+            return x, k, np.linalg.norm(A.dot(x) - b)
+        rho = rho_new
+    return x, max_iter, np.linalg.norm(A.dot(x) - b)
+
+
+def gmres_method(A, b, x0=None, eps=1e-3, max_iter=10000, preconditioner=None, restart=30):
+    # GMRES(m) з правим передобумовленням; ітерація — одне множення на A
+    if np.ndim(b) == 2:
+        return krylov_columns(gmres_method, A, b, x0, preconditioner, eps=eps, max_iter=max_iter,
+                              restart=restart)
+    A, b, x = _krylov_setup(A, b, x0)
+    M = make_preconditioner(A, preconditioner)
+    n = len(b)
+    tol = eps * (np.linalg.norm(b) or 1.0)
+    m = min(restart, n)
+    k = 0
+    while k < max_iter:
+        r = b - A.dot(x)
+        beta = np.linalg.norm(r)
+        if beta <= tol:
+            break
+        V = np.zeros((m + 1, n))
+        H = np.zeros((m + 1, m))
+        cs, sn = np.zeros(m), np.zeros(m)
+        g = np.zeros(m + 1)
+        g[0] = beta
+        V[0] = r / beta
+        for j in range(m):
+            k += 1
+            w = A.dot(M(V[j]))
+            # Модифікований процес Грама–Шмідта
+            for i in range(j + 1):
+                H[i, j] = w.dot(V[i])
+                w -= H[i, j] * V[i]
+            H[j + 1, j] = np.linalg.norm(w)
+            if H[j + 1, j] != 0:
+                V[j + 1] = w / H[j + 1, j]
+            # Обертання Гівенса зводять H до верхньотрикутної форми
+            for i in range(j):
+                H[i, j], H[i + 1, j] = (cs[i] * H[i, j] + sn[i] * H[i + 1, j],
+                                        -sn[i] * H[i, j] + cs[i] * H[i + 1, j])
+            denom = np.hypot(H[j, j], H[j + 1, j])
+            cs[j], sn[j] = H[j, j] / denom, H[j + 1, j] / denom
+            H[j, j] = denom
+            H[j + 1, j] = 0.0
+            g[j + 1] = -sn[j] * g[j]
+            g[j] = cs[j] * g[j]
+            if abs(g[j + 1]) <= tol or k >= max_iter or V[j + 1].dot(V[j + 1]) == 0:
+                break
+        y = np.linalg.solve(H[:j + 1, :j + 1], g[:j + 1])
+        x += M(V[:j + 1].T.dot(y))
+        if abs(g[j + 1]) <= tol:
+            break
+    return x, k, np.linalg.norm(A.dot(x) - b)
+
+
+KRYLOV_METHODS = {
+    'cg': cg_method,
+    'bicgstab': bicgstab_method,
+    'gmres': gmres_method,
+}
+
+
+class SLRApp(tk.Tk if tk is not None else object):
+    PRECONDITIONER_NAMES = {
+        "Без передобумовлення": None,
+        "Якобі (діагональне)": 'jacobi',
+        "ILU(0)": 'ilu0',
+    }
+    STATUS_NAMES = {
+        'converged': "збіжність досягнуто",
+        'diverged': "ітерації розбігаються, розв'язання зупинено",
+        'stagnated': "застій, розв'язання зупинено достроково",
+        'max_iter': "вичерпано ліміт ітерацій",
+    }
+
     def __init__(self):
         super().__init__()
         self.title("Розв'язання СЛР — Якобі / Зейдель")
@@ -126,7 +842,19 @@ class SLRApp(tk.Tk):
         self.method_var = tk.StringVar(value='jacobi')
         ttk.Radiobutton(method_frame, text="Метод Якобі", variable=self.method_var, value='jacobi').grid(row=0, column=0, sticky='w', padx=6)
         ttk.Radiobutton(method_frame, text="Метод Зейделя", variable=self.method_var, value='gs').grid(row=0, column=1, sticky='w', padx=6)
-        ttk.Button(method_frame, text="Розв'язати", command=self.solve_system).grid(row=0, column=2, sticky='e', padx=12)
+        ttk.Radiobutton(method_frame, text="SOR", variable=self.method_var, value='sor').grid(row=0, column=2, sticky='w', padx=6)
+        ttk.Radiobutton(method_frame, text="SSOR", variable=self.method_var, value='ssor').grid(row=0, column=3, sticky='w', padx=6)
+        ttk.Label(method_frame, text="ω (порожньо — авто):").grid(row=0, column=4, sticky='w', padx=(12,0))
+        self.omega_var = tk.StringVar(value="")
+        ttk.Entry(method_frame, textvariable=self.omega_var, width=6).grid(row=0, column=5, sticky='w', padx=6)
+        ttk.Button(method_frame, text="Розв'язати", command=self.solve_system).grid(row=0, column=6, sticky='e', padx=12)
+        ttk.Radiobutton(method_frame, text="CG", variable=self.method_var, value='cg').grid(row=1, column=0, sticky='w', padx=6)
+        ttk.Radiobutton(method_frame, text="BiCGSTAB", variable=self.method_var, value='bicgstab').grid(row=1, column=1, sticky='w', padx=6)
+        ttk.Radiobutton(method_frame, text="GMRES(30)", variable=self.method_var, value='gmres').grid(row=1, column=2, sticky='w', padx=6)
+        ttk.Label(method_frame, text="Передобумовлення:").grid(row=1, column=3, sticky='w', padx=(12,0))
+        self.precond_var = tk.StringVar(value="Без передобумовлення")
+        ttk.Combobox(method_frame, textvariable=self.precond_var, values=list(self.PRECONDITIONER_NAMES),
+                     state='readonly', width=20).grid(row=1, column=4, columnspan=2, sticky='w', padx=6)
 
         self.matrix_frame = ttk.Frame(self)
         self.matrix_frame.pack(padx=12, pady=10, fill='x')
@@ -200,21 +928,52 @@ class SLRApp(tk.Tk):
             A, b = self.get_matrix_vector()
             eps = float(self.eps_var.get())
             x0 = b[:]
-            if self.method_var.get() == 'jacobi':
-                x, iters, rnorm = jacobi_method(A, b, x0=x0, eps=eps, max_iter=20000)
+            method = self.method_var.get()
+            monitor = None
+            if method == 'jacobi':
+                x, iters, rnorm, monitor = jacobi_method(A, b, x0=x0, eps=eps, max_iter=20000, diagnostics=True)
                 method_name = "Якобі"
-            else:
-                x, iters, rnorm = gauss_seidel(A, b, x0=x0, eps=eps, max_iter=20000)
+            elif method == 'gs':
+                x, iters, rnorm, monitor = gauss_seidel(A, b, x0=x0, eps=eps, max_iter=20000, diagnostics=True)
                 method_name = "Зейделя"
+            elif method in KRYLOV_METHODS:
+                preconditioner = self.PRECONDITIONER_NAMES[self.precond_var.get()]
+                x, iters, rnorm = KRYLOV_METHODS[method](A, b, x0=x0, eps=eps, max_iter=20000,
+                                                         preconditioner=preconditioner)
+                method_name = f"{method.upper()} ({self.precond_var.get()})"
+            else:
+                omega_str = self.omega_var.get().strip()
+                omega = (float(omega_str.replace(",", ".")) if omega_str
+                         else optimal_sor_omega(A, symmetric=(method == 'ssor')))
+                x, iters, rnorm = sor_method(A, b, x0=x0, eps=eps, max_iter=20000, omega=omega,
+                                             symmetric=(method == 'ssor'))
+                method_name = f"{method.upper()} (ω = {omega:.4f})"
             self.text_out.insert('end', f"\n Метод {method_name} \nІтерацій: {iters}\n")
+            if monitor is not None:
+                self.text_out.insert('end', f"Спектральний радіус матриці ітерацій ≈ {monitor.spectral_radius:.4f}, "
+                                            f"стан: {self.STATUS_NAMES[monitor.status]}\n")
+            if method in ('sor', 'ssor'):
+                # Порівняння з базовими методами на тій самій системі
+                jacobi_iters = jacobi_method(A, b, x0=x0, eps=eps, max_iter=20000)[1]
+                gs_iters = gauss_seidel(A, b, x0=x0, eps=eps, max_iter=20000)[1]
+                if iters <= gs_iters:
+                    comparison = (f"економія відносно Зейделя: {gs_iters - iters} "
+                                  f"({100 * (gs_iters - iters) / gs_iters:.0f}%)")
+                else:
+                    comparison = f"повільніше за Зейделя на {iters - gs_iters} ітерацій"
+                self.text_out.insert('end', f"Якобі: {jacobi_iters} ітерацій, Зейдель: {gs_iters} ітерацій, "
+                                            f"{comparison}\n")
             for i, val in enumerate(x):
                 self.text_out.insert('end', f"x[{i+1}] = {val:.6f}\n")
             self.text_out.insert('end', f"Норма нев'язки: {rnorm:.6e}\n")
+            self.text_out.insert('end', f"Пам'ять матриці: {matrix_nbytes(A) / 1024:.2f} КБ\n")
             self.text_out.see('end')
         except Exception as e:
             messagebox.showerror("Помилка.", str(e))
 
 
 if __name__ == "__main__":
+    if tk is None:
+        raise SystemExit("Для графічного інтерфейсу потрібен tkinter")
     app = SLRApp()
     app.mainloop()
@@ -1,5 +1,7 @@
 import math
 
+import numpy as np
+
 def f(x):
     return x ** 3 + 2 * x ** 2 + 3 * x + 5
 
@@ -36,6 +38,132 @@ def chord(a, b, eps):
         a, b = b, x
         x_prev = x
 
+# Пакетні версії: те саме рівняння для вектора параметрів. Кожен елемент має свій стан,
+# і на кожній ітерації обчислюються лише ті, що ще не зійшлися (індекси active).
+CONVERGED, NO_BRACKET, ZERO_SLOPE, DIVERGED, MAX_ITER = range(5)
+STATUS_NAMES = {
+    CONVERGED: "зійшовся",
+    NO_BRACKET: "немає зміни знака на [a, b]",
+    ZERO_SLOPE: "нульова похідна або хорда",
+    DIVERGED: "розбігається (inf/nan)",
+    MAX_ITER: "вичерпано ліміт ітерацій",
+}
+
+
+def cubic(x, c):
+    # Сім'я рівнянь x^3 + 2x^2 + 3x + c = 0; при c = 5 — рівняння f(x) = 0.
+    # Схема Горнера: для масивів x ** 3 рахується через pow і в рази повільніший за множення
+    return ((x + 2) * x + 3) * x + c
+
+
+def cubic_der(x, c):
+    return (3 * x + 4) * x + 3
+
+
+def _batch_setup(params, *points):
+    arrays = np.broadcast_arrays(np.asarray(params, dtype=float), *[np.asarray(p, dtype=float) for p in points])
+    arrays = [np.array(arr, dtype=float).ravel() for arr in arrays]
+    n = len(arrays[0])
+    return arrays, np.zeros(n, dtype=np.int64), np.full(n, MAX_ITER, dtype=np.int8)
+
+
+def _retire(finished, active, arrays):
+    # Завершені елементи вилучаються з робочих масивів, щоб далі не коштувати обчислень
+    keep = ~finished
+    return active[keep], [arr[keep] for arr in arrays]
+
+
+def bisection_batch(func, a, b, params, eps, max_iter=200):
+    (params, a, b), iters, status = _batch_setup(params, a, b)
+    fa, fb = func(a, params), func(b, params)
+    bad = fa * fb > 0
+    status[bad] = NO_BRACKET
+    # Корінь точно в кінці відрізка: інакше умова fa * fc < 0 ніколи не виконується
+    # і відрізок «з'їжджає» до іншого кінця
+    at_a = ~bad & (fa == 0)
+    at_b = ~bad & ~at_a & (fb == 0)
+    b[at_a], a[at_b] = a[at_a], b[at_b]
+    status[at_a | at_b] = CONVERGED
+    active = np.flatnonzero(~bad & ~at_a & ~at_b)
+    aa, bb, fa, pa = a[active], b[active], fa[active], params[active]
+    for k in range(1, max_iter + 1):
+        if not len(active):
+            break
+        c = (aa + bb) / 2
+        fc = func(c, pa)
+        # fc == 0 — середина і є коренем, відрізок стягується в точку
+        exact = fc == 0
+        left = fa * fc < 0
+        bb = np.where(left | exact, c, bb)
+        aa = np.where(left, aa, c)
+        fa = np.where(left, fa, fc)
+        done = exact | (np.abs(bb - aa) <= eps)
+        if done.any():
+            idx = active[done]
+            a[idx], b[idx], iters[idx], status[idx] = aa[done], bb[done], k, CONVERGED
+            active, (aa, bb, fa, pa) = _retire(done, active, (aa, bb, fa, pa))
+    a[active], b[active], iters[active] = aa, bb, max_iter
+    roots = (a + b) / 2
+    roots[status == NO_BRACKET] = np.nan
+    return roots, iters, status
+
+
+def newton_batch(func, dfunc, x0, params, eps, max_iter=100):
+    (params, x), iters, status = _batch_setup(params, x0)
+    active = np.arange(len(x))
+    xa, pa = x.copy(), params
+    for k in range(1, max_iter + 1):
+        if not len(active):
+            break
+        fx, d = func(xa, pa), dfunc(xa, pa)
+        # Якщо f(x) = 0, точка вже корінь і нульова похідна не заважає
+        zero = (d == 0) & (fx != 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_new = np.where(d == 0, xa, xa - fx / d)
+        bad = ~np.isfinite(x_new)
+        done = ~zero & ~bad & (np.abs(x_new - xa) < eps)
+        xa = x_new
+        finished = zero | bad | done
+        if finished.any():
+            idx = active[finished]
+            x[idx], iters[idx] = xa[finished], k
+            status[active[zero]] = ZERO_SLOPE
+            status[active[bad & ~zero]] = DIVERGED
+            status[active[done]] = CONVERGED
+            active, (xa, pa) = _retire(finished, active, (xa, pa))
+    x[active], iters[active] = xa, max_iter
+    return x, iters, status
+
+
+def chord_batch(func, a, b, params, eps, max_iter=100):
+    # f(a) нового кроку — це f(b) попереднього, тож одне обчислення f на ітерацію
+    (params, a, b), iters, status = _batch_setup(params, a, b)
+    x = b.copy()
+    active = np.arange(len(x))
+    aa, bb, pa = a, b, params
+    fa, fb = func(aa, pa), func(bb, pa)
+    for k in range(1, max_iter + 1):
+        if not len(active):
+            break
+        zero = (fb == fa) & (fb != 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            xa = np.where(fb == fa, bb, bb - fb * (bb - aa) / (fb - fa))
+        bad = ~np.isfinite(xa)
+        done = ~zero & ~bad & (np.abs(xa - bb) < eps)
+        aa, bb, fa = bb, xa, fb
+        finished = zero | bad | done
+        if finished.any():
+            idx = active[finished]
+            x[idx], iters[idx] = xa[finished], k
+            status[active[zero]] = ZERO_SLOPE
+            status[active[bad & ~zero]] = DIVERGED
+            status[active[done]] = CONVERGED
+            active, (aa, bb, fa, pa) = _retire(finished, active, (aa, bb, fa, pa))
+        fb = func(bb, pa)
+    x[active], iters[active] = bb, max_iter
+    return x, iters, status
+
+
 if __name__ == "__main__":
     eps = 0.001
 
@@ -45,4 +173,14 @@ if __name__ == "__main__":
 
     print("Корінь методом половинного ділення:", root_bis)
     print("Корінь методом Ньютона:", root_newt)
-    print("Корінь методом хорд", root_chord)
\ No newline at end of file
+    print("Корінь методом хорд", root_chord)
+
+    c = np.linspace(1, 10, 100000)
+    print("\nСім'я рівнянь x^3 + 2x^2 + 3x + c = 0, c від 1 до 10,", len(c), "значень:")
+    for name, (roots, iters, status) in (
+            ("половинного ділення", bisection_batch(cubic, -5, 5, c, eps)),
+            ("Ньютона", newton_batch(cubic, cubic_der, -1.5, c, eps)),
+            ("хорд", chord_batch(cubic, -5, 5, c, eps))):
+        ok = status == CONVERGED
+        print(f"Метод {name}: зійшлося {ok.sum()}, корені від {roots[ok].min():.6f} до {roots[ok].max():.6f}, "
+              f"ітерацій у середньому {iters.mean():.1f}, найбільше {iters.max()}")
\ No newline at end of file
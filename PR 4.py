@@ -1,46 +1,184 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from sympy import symbols, sympify, lambdify
 import tkinter as tk
 from tkinter import ttk, messagebox
 
-def bisection_method(a, b, f, eps=1e-3):
-    steps = []
+class StepBuffer:
+    # Кроки методу зберігаються рядками одного масиву float (останній стовпець — номер ітерації),
+    # кортеж створюється лише при зверненні до кроку. З cap зберігаються тільки останні cap кроків.
+    def __init__(self, width, cap=None):
+        self.data = np.empty((cap or 16, width))
+        self.cap = cap
+        self.size = 0
+        self.total = 0
+
+    def append(self, *step):
+        if self.cap is None and self.size == len(self.data):
+            self.data = np.concatenate([self.data, np.empty_like(self.data)])
+        self.data[self.total % len(self.data)] = step
+        self.total += 1
+        self.size = min(self.size + 1, len(self.data))
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, k):
+        if k < 0:
+            k += self.size
+        if not 0 <= k < self.size:
+            raise IndexError("крок поза межами")
+        row = self.data[(self.total - self.size + k) % len(self.data)]
+        return tuple(row[:-1].tolist()) + (int(row[-1]),)
+
+def bisection_method(a, b, f, eps=1e-3, max_steps=None):
+    steps = StepBuffer(4, max_steps)
+    fa = f(a)
     i = 0
     while abs(b - a) >= eps:
         i += 1
         z = (a + b) / 2
-        steps.append((a, b, z, i))
-        if f(a) * f(z) <= 0:
+        steps.append(a, b, z, i)
+        fz = f(z)
+        if fa * fz <= 0:
             b = z
         else:
-            a = z
+            a, fa = z, fz
     return steps
 
-def newton_method(a, b, f, f_der, eps=1e-3):
-    steps = []
+def newton_method(a, b, f, f_der, eps=1e-3, max_iter=100, max_steps=None):
+    steps = StepBuffer(3, max_steps)
     x = (a + b) / 2
     i = 0
-    while True:
+    while i < max_iter:
         i += 1
-        x_new = x - f(x) / f_der(x)
-        steps.append((x, x_new, i))
+        d = f_der(x)
+        if d == 0:
+            break
+        x_new = x - f(x) / d
+        steps.append(x, x_new, i)
         if abs(x_new - x) < eps:
             break
         x = x_new
     return steps
 
-def chord_method(a, b, f, eps=1e-3):
-    steps = []
+def chord_method(a, b, f, eps=1e-3, max_iter=100, max_steps=None):
+    steps = StepBuffer(4, max_steps)
+    # Значення f у двох останніх точках зберігаються, тож одне нове обчислення на ітерацію
     x0, x1 = a, b
+    f0, f1 = f(x0), f(x1)
     i = 0
-    while abs(x1 - x0) > eps:
+    while abs(x1 - x0) > eps and i < max_iter:
         i += 1
-        x2 = x1 - f(x1) * (x1 - x0) / (f(x1) - f(x0))
-        steps.append((x0, x1, x2, i))
+        if f1 == f0:
+            break
+        x2 = x1 - f1 * (x1 - x0) / (f1 - f0)
+        steps.append(x0, x1, x2, i)
         x0, x1 = x1, x2
+        f0, f1 = f1, f(x2)
+    return steps
+
+def brent_method(a, b, f, eps=1e-3, max_iter=100, max_steps=None):
+    # Метод Брента: відрізок зі зміною знака зберігається завжди, а крок робиться
+    # оберненою квадратичною інтерполяцією або січною, лише якщо він лишається всередині
+    # і достатньо швидко зменшує відрізок; інакше — бісекція. Одне обчислення f на ітерацію.
+    steps = StepBuffer(4, max_steps)
+    fa, fb = f(a), f(b)
+    if fa * fb > 0:
+        return steps
+    c, fc = b, fb
+    d = e = b - a
+    for i in range(1, max_iter + 1):
+        if (fb > 0 and fc > 0) or (fb < 0 and fc < 0):
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol = 2 * np.finfo(float).eps * abs(b) + 0.5 * eps
+        xm = 0.5 * (c - b)
+        steps.append(min(b, c), max(b, c), b, i)
+        if abs(xm) <= tol or fb == 0:
+            break
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                p, q = 2 * xm * s, 1 - s
+            else:
+                q, r = fa / fc, fb / fc
+                p = s * (2 * xm * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2 * p < min(3 * xm * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = xm
+        else:
+            d = e = xm
+        a, fa = b, fb
+        b += d if abs(d) > tol else (tol if xm > 0 else -tol)
+        fb = f(b)
     return steps
 
+class CountingFunction:
+    # Обгортка, що рахує обчислення функції — для порівняння методів
+    def __init__(self, f):
+        self.f = f
+        self.calls = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        return self.f(x)
+
+def run_method(method, a, b, f, f_der):
+    if method == "Бісекція":
+        return bisection_method(a, b, f)
+    if method == "Ньютона":
+        return newton_method(a, b, f, f_der)
+    if method == "Брента":
+        return brent_method(a, b, f)
+    return chord_method(a, b, f)
+
+def sample_function(f, xs):
+    # lambdify повертає скаляр для сталих виразів і комплексні числа поза областю визначення
+    with np.errstate(all="ignore"):
+        ys = np.asarray(f(xs))
+    if np.iscomplexobj(ys):
+        ys = np.where(ys.imag == 0, ys.real, np.nan)
+    return np.broadcast_to(ys.astype(float), np.shape(xs))
+
+def find_all_roots(f, a, b, samples=10001, eps=1e-10):
+    # Один прохід по щільній сітці знаходить усі зміни знака, далі бісекція йде одночасно
+    # на всіх відрізках: кожен крок — одне обчислення f на масиві середин.
+    # Корені парної кратності (дотик без зміни знака) так не знаходяться.
+    xs = np.linspace(a, b, samples)
+    ys = sample_function(f, xs)
+    exact = xs[ys == 0]
+    signs = np.sign(ys)
+    idx = np.flatnonzero(signs[:-1] * signs[1:] < 0)
+    lo, hi = xs[idx], xs[idx + 1]
+    f_lo = ys[idx]
+    bound = np.maximum(np.abs(ys[idx]), np.abs(ys[idx + 1]))
+
+    # Усі відрізки однакової довжини, тож кількість кроків спільна
+    steps = int(np.ceil(np.log2((xs[1] - xs[0]) / eps))) if len(idx) else 0
+    for _ in range(max(steps, 0)):
+        mid = (lo + hi) / 2
+        f_mid = sample_function(f, mid)
+        left = np.sign(f_lo) * np.sign(f_mid) <= 0
+        hi = np.where(left, mid, hi)
+        lo = np.where(left, lo, mid)
+        f_lo = np.where(left, f_lo, f_mid)
+
+    roots = (lo + hi) / 2
+    # Розрив (напр. tan(x) біля pi/2) теж змінює знак, але там |f| не спадає до нуля
+    keep = np.abs(sample_function(f, roots)) <= bound
+    return np.sort(np.concatenate([exact, roots[keep]]))
+
 class App:
     def __init__(self, root):
         self.root = root
@@ -74,7 +212,7 @@ class App:
         self.b_entry = self.create_entry(frame)
 
         # Combobox
-        self.method_box = ttk.Combobox(frame, values=["Бісекція", "Ньютона", "Хорд"], font=("Segoe UI", 11))
+        self.method_box = ttk.Combobox(frame, values=["Бісекція", "Ньютона", "Хорд", "Брента"], font=("Segoe UI", 11))
         self.method_box.current(0)
 
         # Layout
@@ -94,10 +232,16 @@ class App:
         self.create_button(root, "Обчислити", "#0078ff", self.compute).place(x=130, y=260)
         self.create_button(root, "← Назад", "#444444", self.prev_step).place(x=300, y=260)
         self.create_button(root, "Далі →", "#444444", self.next_step).place(x=430, y=260)
+        self.create_button(root, "Усі корені", "#0078ff", self.find_roots).place(x=540, y=260)
+
+        # Evaluation counts of all methods
+        self.evals_label = tk.Label(root, text="", bg="#1b1b1b", fg="#aaaaaa", font=("Segoe UI", 10))
+        self.evals_label.place(x=25, y=305)
 
-        # Steps and expr
+        # Steps and plot
         self.steps = []
         self.current_step = 0
+        self.plot_window = None
 
     def create_entry(self, parent):
         entry = tk.Entry(parent, font=("Segoe UI", 11), bg="#2a2a2a", fg="white",
@@ -113,7 +257,7 @@ class App:
         )
         return btn
 
-    def compute(self):
+    def read_input(self):
         func_str = self.func_entry.get().strip()
         a_str = self.a_entry.get().strip()
         b_str = self.b_entry.get().strip()
@@ -123,60 +267,110 @@ class App:
             b = float(b_str.replace(",", "."))
         except:
             messagebox.showerror("Помилка", "a та b мають бути числами!")
-            return
+            return None
 
-        x = symbols("x")
         try:
             expr = sympify(func_str)
         except:
             messagebox.showerror("Помилка", "Невірна функція!")
+            return None
+        return a, b, expr
+
+    def find_roots(self):
+        data = self.read_input()
+        if data is None:
+            return
+        a, b, expr = data
+        f = lambdify(symbols("x"), expr, "numpy")
+        roots = find_all_roots(f, min(a, b), max(a, b))
+        if len(roots) == 0:
+            messagebox.showinfo("Усі корені", f"На [{a}, {b}] змін знака f(x) не знайдено.")
+            return
+        lines = [f"x{i + 1} = {r:.10f}" for i, r in enumerate(roots[:30])]
+        if len(roots) > 30:
+            lines.append(f"... і ще {len(roots) - 30}")
+        messagebox.showinfo("Усі корені", f"Знайдено коренів: {len(roots)}\n" + "\n".join(lines))
+
+    def compute(self):
+        data = self.read_input()
+        if data is None:
             return
+        a, b, expr = data
+        x = symbols("x")
 
         f = lambdify(x, expr, "numpy")
         f_der = lambdify(x, expr.diff(), "numpy")
 
         method = self.method_box.get()
-
-        if method == "Бісекція":
-            self.steps = bisection_method(a, b, f)
-        elif method == "Ньютона":
-            self.steps = newton_method(a, b, f, f_der)
-        else:
-            self.steps = chord_method(a, b, f)
+        self.steps = run_method(method, a, b, f, f_der)
+        self.show_eval_counts(a, b, f, f_der)
 
         if not self.steps:
             messagebox.showerror("Помилка", "Метод не дав результату.")
             return
 
+        # Крива обчислюється один раз на compute(), кроки змінюють лише маркери
+        self.curve_x = np.linspace(min(-10, a, b), max(10, a, b), 500)
+        self.curve_y = sample_function(f, self.curve_x)
         self.current_step = 0
-        self.expr = expr
+        self.show_curve()
         self.draw_step()
 
-    def draw_step(self):
-        plt.style.use("dark_background")
-        plt.clf()
-        ax = plt.gca()
+    def show_eval_counts(self, a, b, f, f_der):
+        parts = []
+        for method in self.method_box["values"]:
+            f_counted, der_counted = CountingFunction(f), CountingFunction(f_der)
+            try:
+                steps = run_method(method, a, b, f_counted, der_counted)
+            except Exception:
+                steps = []
+            if not steps:
+                parts.append(f"{method}: —")
+            elif der_counted.calls:
+                parts.append(f"{method}: {f_counted.calls} + {der_counted.calls} f'")
+            else:
+                parts.append(f"{method}: {f_counted.calls}")
+        self.evals_label.config(text="Обчислень f(x): " + " · ".join(parts))
+
+    def create_plot(self):
+        # Вікно з графіком створюється один раз і перевикористовується, поки його не закрили
+        self.plot_window = tk.Toplevel(self.root)
+        self.plot_window.title("Графік")
+        with plt.style.context("dark_background"):
+            fig = Figure(figsize=(7, 5))
+            self.ax = fig.add_subplot()
+            self.ax.axhline(0, color="white", linewidth=0.8)
+            self.ax.grid(color="#444444")
+            self.curve, = self.ax.plot([], [], color="#00eaff", linewidth=2)
+            self.markers = self.ax.scatter([], [], zorder=3)
+            self.title = self.ax.set_title("", color="white")
+        self.canvas = FigureCanvasTkAgg(fig, master=self.plot_window)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True)
+
+    def show_curve(self):
+        if self.plot_window is None or not self.plot_window.winfo_exists():
+            self.create_plot()
+        self.curve.set_data(self.curve_x, self.curve_y)
+        self.ax.relim()
+        self.ax.autoscale_view()
 
-        xs = np.linspace(-10, 10, 500)
-        f = lambdify(symbols("x"), self.expr, "numpy")
-        ys = f(xs)
-
-        ax.plot(xs, ys, color="#00eaff", linewidth=2)
-        ax.axhline(0, color="white", linewidth=0.8)
+    def draw_step(self):
+        if not self.plot_window.winfo_exists():
+            self.show_curve()
 
         step = self.steps[self.current_step]
 
         if len(step) == 4:
             a, b, z, i = step
-            ax.scatter([a, b, z], [0, 0, 0], color="red")
-            ax.set_title(f"Ітерація {i} — x = {z:.6f}", color="white")
+            points, color, x = [a, b, z], "red", z
         else:
             x_old, x_new, i = step
-            ax.scatter([x_old, x_new], [0, 0], color="#00ff7b")
-            ax.set_title(f"Ітерація {i} — x = {x_new:.6f}", color="white")
+            points, color, x = [x_old, x_new], "#00ff7b", x_new
 
-        ax.grid(color="#444444")
-        plt.show()
+        self.markers.set_offsets(np.column_stack([points, np.zeros(len(points))]))
+        self.markers.set_color(color)
+        self.title.set_text(f"Ітерація {i} — x = {x:.6f}")
+        self.canvas.draw_idle()
 
     def next_step(self):
         if self.current_step < len(self.steps) - 1:
@@ -189,6 +383,7 @@ class App:
             self.draw_step()
 
 
-root = tk.Tk()
-app = App(root)
-root.mainloop()
+if __name__ == "__main__":
+    root = tk.Tk()
+    app = App(root)
+    root.mainloop()
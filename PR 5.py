@@ -1,11 +1,83 @@
+import math
 import tkinter as tk
 from tkinter import messagebox, scrolledtext
-from sympy import symbols, sympify, diff, Abs, lambdify
+from sympy import symbols, sympify, diff, lambdify
 import numpy as np
 import matplotlib.pyplot as plt
 
 
-def solve_iteration(x0, epsilon, phi_expr, f_expr):
+FIXED_POINT_METHODS = {
+    "plain": "Проста ітерація",
+    "aitken": "Ейткен Δ²",
+    "steffensen": "Стеффенсен",
+    "anderson": "Андерсон (m=1)",
+}
+
+
+def fixed_point(phi, x0, eps, method="plain", max_iter=1000):
+    # phi має повертати float (lambdify з modules='math'), тож у циклі лише арифметика Python.
+    # Повертає (x, ітерацій, обчислень phi, останній крок, None) або з текстом причини замість None.
+    #   plain      — x = phi(x)
+    #   aitken     — та сама послідовність, але наближенням є її Δ²-екстраполяція за трьома точками
+    #   steffensen — Δ²-крок з x, phi(x), phi(phi(x)) і перезапуск з результату (2 обчислення на ітерацію)
+    #   anderson   — змішування з глибиною 1; для скалярного x це метод січних для g(x) = phi(x) - x
+    # Прискорені кроки можуть «застрягти» далеко від кореня, тому малий крок у них приймається
+    # лише разом з малою нев'язкою |phi(x) - x|.
+    if method not in FIXED_POINT_METHODS:
+        raise ValueError(f"Невідомий метод: {method}")
+    x = float(x0)
+    x_prev = f_prev = None
+    estimate, delta, evals, k = x, math.inf, 0, 0
+    try:
+        for k in range(1, max_iter + 1):
+            fx = phi(x)
+            evals += 1
+            if method in ("steffensen", "anderson") and delta <= eps and abs(fx - x) <= eps:
+                return x, k - 1, evals, delta, None
+
+            if method == "steffensen":
+                x2 = phi(fx)
+                evals += 1
+                den = x2 - 2 * fx + x
+                x_new = x - (fx - x) ** 2 / den if den != 0 else x2
+            elif method == "anderson":
+                x_new = fx
+                if x_prev is not None:
+                    dg = (fx - x) - (f_prev - x_prev)
+                    if dg != 0:
+                        x_new = fx - (fx - x) * (fx - f_prev) / dg
+                x_prev, f_prev = x, fx
+            else:
+                x_new = fx
+
+            if method == "aitken":
+                new_estimate = x_new
+                if x_prev is not None:
+                    den = x_new - 2 * x + x_prev
+                    if den != 0:
+                        new_estimate = x_new - (x_new - x) ** 2 / den
+                x_prev = x
+            else:
+                new_estimate = x_new
+            delta = abs(new_estimate - estimate)
+            x, estimate = x_new, new_estimate
+
+            if not math.isfinite(estimate):
+                return estimate, k, evals, delta, "Ітерації розбігаються"
+            if method == "plain" and delta <= eps:
+                return estimate, k, evals, delta, None
+            if method == "aitken" and delta <= eps:
+                evals += 1
+                if abs(phi(estimate) - estimate) <= eps:
+                    return estimate, k, evals, delta, None
+    except OverflowError:
+        return estimate, k, evals, delta, "Ітерації розбігаються"
+    except (ValueError, ZeroDivisionError, TypeError) as e:
+        return estimate, k, evals, delta, f"Вихід з області визначення phi ({e})"
+    return estimate, max_iter, evals, delta, "Перевищено ліміт ітерацій"
+
+
+def solve_iteration(x0, epsilon, phi_expr, f_expr, methods=tuple(FIXED_POINT_METHODS)):
     x = symbols('x')
     try:
         phi_expr_fixed = phi_expr.replace('ln', 'log')
@@ -14,28 +86,31 @@ def solve_iteration(x0, epsilon, phi_expr, f_expr):
         phi_func_sym = sympify(phi_expr_fixed)
         d_phi_sym = diff(phi_func_sym, x)
 
-        phi_func = lambdify(x, phi_func_sym, modules='numpy')
-        d_phi_func = lambdify(x, d_phi_sym, modules='numpy')
-
-        val_d = Abs(d_phi_func(x0))
-
-        if val_d >= 1:
-            return f"Збіжність не гарантована: |phi'(x)| = {val_d:.4f} >= 1", 0.0, 0
+        phi_func = lambdify(x, phi_func_sym, modules='math')
+        d_phi_func = lambdify(x, d_phi_sym, modules='math')
 
-        x_curr = x0
-        iterations = 0
+        # Збіжність визначається самими ітераціями, а не лише |phi'(x0)|:
+        # прискорені варіанти збігаються і там, де проста ітерація — ні
+        results = {m: fixed_point(phi_func, x0, epsilon, m) for m in methods}
+        table = [f"{'Варіант':<16} {'x':>12} {'ітер.':>6} {'обч. phi':>9}"]
+        for m in methods:
+            x_m, iters, evals, _, error = results[m]
+            if error is None:
+                table.append(f"{FIXED_POINT_METHODS[m]:<16} {x_m:>12.6f} {iters:>6} {evals:>9}")
+            else:
+                table.append(f"{FIXED_POINT_METHODS[m]:<16} {error}")
 
-        while True:
-            x_next = phi_func(x_curr)
-            iterations += 1
+        converged = [m for m in methods if results[m][4] is None]
+        if not converged:
+            return "Жоден варіант не зійшовся:\n" + "\n".join(table), 0.0, 0
 
-            if Abs(x_next - x_curr) <= epsilon:
-                break
+        best = min(converged, key=lambda m: results[m][2])
+        x_curr, iterations, _, delta, _ = results[best]
 
-            x_curr = x_next
-
-            if iterations > 1000:
-                return "Перевищено ліміт ітерацій", 0.0, 0
+        try:
+            val_d = f"|phi'(x)| у корені: {abs(d_phi_func(x_curr)):.4f}"
+        except (ValueError, OverflowError, ZeroDivisionError, TypeError):
+            val_d = ""
 
         if f_expr:
             f_func = lambdify(x, sympify(f_expr_fixed), modules='numpy')
@@ -45,9 +120,12 @@ def solve_iteration(x0, epsilon, phi_expr, f_expr):
             f_check_str = ""
 
         result = (f"Корінь: {x_curr:.6f}\n"
+                  f"Найменше обчислень: {FIXED_POINT_METHODS[best]}\n"
                   f"Ітерацій: {iterations}\n"
-                  f"Точність: {Abs(x_next - x_curr):.2e}\n"
-                  f"{f_check_str}")
+                  f"Точність: {delta:.2e}\n"
+                  f"{val_d}\n"
+                  f"{f_check_str}\n\n"
+                  + "\n".join(table))
 
         return result, x_curr, iterations
 
@@ -1,9 +1,17 @@
 import eel
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
+from matplotlib.figure import Figure
 import io
 import base64
+import os
+import sys
 
+# Планувальник обчислень і кеш графіків спільні з IntegrationMethods
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from eel_jobs import JobScheduler, PlotCache
+
+matplotlib.use('Agg')
 eel.init('web')
 
 
@@ -13,59 +21,93 @@ def get_safe_math_context():
     return safe_dict
 
 
+def make_user_func(func_str):
+    math_context = get_safe_math_context()
+
+    def user_func(x):
+        local_context = math_context.copy()
+        local_context['x'] = x
+        return eval(func_str, {"__builtins__": {}}, local_context)
+
+    return user_func
+
+
+def render_plot(func_str, a, b):
+    user_func = make_user_func(func_str)
+    fig = Figure(figsize=(6, 4))
+    ax = fig.subplots()
+    x_plot = np.linspace(a - (b - a) * 0.1, b + (b - a) * 0.1, 200)
+    y_plot = user_func(x_plot)
+
+    ax.plot(x_plot, y_plot, label=f'f(x) = {func_str}', color='blue')
+    ax.axhline(0, color='black', linewidth=0.5)
+
+    x_fill = np.linspace(a, b, 100)
+    y_fill = user_func(x_fill)
+    ax.fill_between(x_fill, y_fill, color='skyblue', alpha=0.4, label='Area')
+
+    ax.set_title(f"f(x) на [{a}, {b}]")
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png')
+    return base64.b64encode(buf.getvalue()).decode('utf-8')
+
+
+PLOTS = PlotCache(render_plot)
+
+
 @eel.expose
-def calculate_integral(func_str, a_str, b_str, n_str):
-    try:
-        a = float(a_str)
-        b = float(b_str)
-        n = int(n_str)
+def get_plot(plot_key):
+    return PLOTS.get(plot_key)
 
-        if n <= 0:
-            return {"error": "Кількість кроків має бути > 0"}
 
-        math_context = get_safe_math_context()
+def compute_integral(func_str, a, b, n):
+    user_func = make_user_func(func_str)
 
-        def user_func(x):
-            local_context = math_context.copy()
-            local_context['x'] = x
-            return eval(func_str, {"__builtins__": {}}, local_context)
+    h = (b - a) / n
+    total_area = 0.0
+    for i in range(n):
+        x_mid = a + (i + 0.5) * h
+        total_area += user_func(x_mid)
 
-        h = (b - a) / n
-        total_area = 0.0
-        for i in range(n):
-            x_mid = a + (i + 0.5) * h
-            total_area += user_func(x_mid)
+    return float(total_area * h)
 
-        result = total_area * h
 
-        plt.figure(figsize=(6, 4))
-        x_plot = np.linspace(a - (b - a) * 0.1, b + (b - a) * 0.1, 200)
-        y_plot = user_func(x_plot)
+SCHEDULER = JobScheduler()
 
-        plt.plot(x_plot, y_plot, label=f'f(x) = {func_str}', color='blue')
-        plt.axhline(0, color='black', linewidth=0.5)
 
-        x_fill = np.linspace(a, b, 100)
-        y_fill = user_func(x_fill)
-        plt.fill_between(x_fill, y_fill, color='skyblue', alpha=0.4, label='Area')
+@eel.expose
+def cancel_job(job_id):
+    SCHEDULER.cancel(job_id)
+
+
+@eel.expose
+def calculate_integral(func_str, a_str, b_str, n_str, job_id=None):
+    try:
+        a = float(a_str)
+        b = float(b_str)
+        n = int(n_str)
+
+        if n <= 0:
+            return {"error": "Кількість кроків має бути > 0"}
 
-        plt.title(f"Інтеграл = {result:.5f}")
-        plt.legend()
-        plt.grid(True, alpha=0.3)
+        ok, result = SCHEDULER.run(job_id or os.urandom(8).hex(), compute_integral, func_str, a, b, n)
+        if not ok:
+            return {"error": result, "result": None, "plot_key": None}
 
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png')
-        buf.seek(0)
-        img_str = base64.b64encode(buf.read()).decode('utf-8')
-        plt.close()
+        plot_key = PLOTS.request(func_str, a, b)
 
         return {
             "result": result,
-            "image": img_str,
+            "plot_key": plot_key,
             "error": None
         }
     except Exception as e:
-        return {"error": str(e), "result": None, "image": None}
+        return {"error": str(e), "result": None, "plot_key": None}
 
 if __name__ == '__main__':
+    # Процеси обчислень запускаються разом із застосунком, а не на першому запиті
+    SCHEDULER.start()
     eel.start('index.html', mode='edge', size=(800, 750))
\ No newline at end of file
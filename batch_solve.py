@@ -0,0 +1,242 @@
+import argparse
+import csv
+import importlib.util
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_script(file_name, module_name):
+    # Файли практичних робіт мають пробіли в назвах, тому імпортуються за шляхом
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(ROOT, file_name))
+    module = importlib.util.module_from_spec(spec)
+    # Реєстрація потрібна, щоб об'єкти модуля (напр. CSRMatrix) передавались у процеси пулу
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+work = load_script("work.py", "work")
+slr = load_script("PR 2.py", "pr2")
+
+
+# Формати вхідних файлів:
+#   .npy — розширена матриця [A | b] форми (n, n + 1) або стос систем (m, n, n + 1);
+#          відкривається через memory-map, і кожен процес читає лише свою систему
+#   .npz — масиви A (n, n) або (m, n, n) та b (n,) або (m, n)
+#   .csv — розширені матриці [A | b], системи розділені порожнім рядком
+#   .mtx — Matrix Market (coordinate або array); права частина — у файлі <ім'я>_b.mtx
+def read_npy(path):
+    data = np.load(path, mmap_mode='r')
+    if data.ndim == 2:
+        return [(f"{path}", (path, None))]
+    return [(f"{path}[{i}]", (path, i)) for i in range(data.shape[0])]
+
+
+def open_npy_system(path, index):
+    data = np.load(path, mmap_mode='r')
+    if index is not None:
+        data = data[index]
+    return np.array(data[:, :-1]), np.array(data[:, -1])
+
+
+def read_npz(path):
+    with np.load(path) as data:
+        A, b = data['A'], data['b']
+    if A.ndim == 2:
+        return [(path, (A, b))]
+    return [(f"{path}[{i}]", (A[i], b[i])) for i in range(A.shape[0])]
+
+
+def read_csv(path):
+    with open(path, encoding='utf-8') as f:
+        blocks = [block for block in f.read().replace('\r\n', '\n').split('\n\n') if block.strip()]
+    systems = []
+    for i, block in enumerate(blocks):
+        M = np.atleast_2d(np.loadtxt(io.StringIO(block), delimiter=','))
+        if M.shape[1] != M.shape[0] + 1:
+            raise ValueError(f"{path}: система {i + 1} має бути розширеною матрицею n x (n + 1)")
+        name = path if len(blocks) == 1 else f"{path}[{i}]"
+        systems.append((name, (M[:, :-1], M[:, -1])))
+    return systems
+
+
+def read_matrix_market(path):
+    with open(path, encoding='utf-8') as f:
+        header = f.readline().lower().split()
+        if len(header) < 5 or header[0] != '%%matrixmarket' or header[1] != 'matrix':
+            raise ValueError(f"{path}: не файл Matrix Market")
+        layout, field, symmetry = header[2], header[3], header[4]
+        if field not in ('real', 'integer'):
+            raise ValueError(f"{path}: підтримуються лише дійсні матриці")
+        line = f.readline()
+        while line.startswith('%') or not line.strip():
+            line = f.readline()
+        size = [int(v) for v in line.split()]
+        values = np.loadtxt(f, ndmin=2) if layout == 'coordinate' else np.loadtxt(f, ndmin=1)
+    rows, cols = size[0], size[1]
+    if layout == 'array':
+        # Формат array зберігає значення по стовпцях
+        return values.reshape(cols, rows).T
+    i, j, v = values[:, 0].astype(np.int64) - 1, values[:, 1].astype(np.int64) - 1, values[:, 2]
+    if symmetry in ('symmetric', 'skew-symmetric'):
+        off = i != j
+        sign = -1.0 if symmetry == 'skew-symmetric' else 1.0
+        i, j, v = np.concatenate([i, j[off]]), np.concatenate([j, i[off]]), np.concatenate([v, sign * v[off]])
+    return slr.CSRMatrix.from_coo(i, j, v, (rows, cols))
+
+
+def read_mtx(path):
+    A = read_matrix_market(path)
+    b_path = os.path.splitext(path)[0] + '_b.mtx'
+    if not os.path.exists(b_path):
+        raise ValueError(f"{path}: не знайдено праву частину {b_path}")
+    b = read_matrix_market(b_path)
+    b = b.toarray() if slr.is_sparse(b) else b
+    return [(path, (A, b.ravel()))]
+
+
+READERS = {
+    '.npy': read_npy,
+    '.npz': read_npz,
+    '.csv': read_csv,
+    '.mtx': read_mtx,
+}
+
+
+def read_systems(paths):
+    systems = []
+    for path in paths:
+        ext = os.path.splitext(path)[1].lower()
+        if ext not in READERS:
+            raise ValueError(f"{path}: невідомий формат (очікується {', '.join(READERS)})")
+        if ext == '.mtx' and path.endswith('_b.mtx'):
+            continue
+        systems += READERS[ext](path)
+    return systems
+
+
+def dense(A):
+    return A.toarray() if slr.is_sparse(A) else np.asarray(A, dtype=float)
+
+
+def solve_gauss(A, b, eps, max_iter):
+    # У пакеті кожна система своя, тож кеш lu_factor лише хешував би матрицю й тримав зайві розклади
+    lu = work.LUFactorization(dense(A))
+    if lu.singular:
+        return None, 0, 'singular'
+    return lu.solve(b), 0, 'solved'
+
+
+def solve_iterative(solver):
+    def solve(A, b, eps, max_iter):
+        x, k, _, monitor = solver(A, b, eps=eps, max_iter=max_iter, diagnostics=True)
+        return x, k, monitor.status
+    return solve
+
+
+# gauss_method у work.py вже розв'язує через LU-розклад, тож 'gauss' і 'lu' — одна функція;
+# обидві назви лишені для сумісності зі звичними назвами методів
+METHODS = {
+    'gauss': solve_gauss,
+    'lu': solve_gauss,
+    'jacobi': solve_iterative(slr.jacobi_method),
+    'seidel': solve_iterative(slr.gauss_seidel),
+}
+
+
+def solve_task(task):
+    name, source, method, eps, max_iter = task
+    try:
+        A, b = open_npy_system(*source) if isinstance(source[0], str) else source
+        if A.shape[0] != A.shape[1] or A.shape[0] != len(b):
+            raise ValueError(f"розміри A {A.shape} і b {b.shape} не узгоджені")
+        b = np.asarray(b, dtype=float)
+        if method in ('jacobi', 'seidel') and not slr.is_sparse(A):
+            A = np.asarray(A, dtype=float)
+        with np.errstate(all='ignore'):
+            x, iters, status = METHODS[method](A, b, eps, max_iter)
+        if x is None:
+            return name, status, iters, float('nan'), None
+        return name, status, iters, float(np.linalg.norm(A.dot(x) - b)), np.asarray(x, dtype=float)
+    except Exception as e:
+        return name, f"error: {e}", 0, float('nan'), None
+
+
+def write_npz(path, results):
+    names, statuses, iterations, residuals, solutions = zip(*results)
+    arrays = {
+        'names': np.array(names),
+        'status': np.array(statuses),
+        'iterations': np.array(iterations),
+        'residual': np.array(residuals),
+    }
+    sizes = {len(x) for x in solutions if x is not None}
+    if len(sizes) == 1 and all(x is not None for x in solutions):
+        arrays['x'] = np.stack(solutions)
+    else:
+        # Системи різного розміру або з помилками — окремий масив на кожен розв'язок
+        for i, x in enumerate(solutions):
+            if x is not None:
+                arrays[f'x_{i}'] = x
+    np.savez(path, **arrays)
+
+
+def write_csv(path, results):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['system', 'status', 'iterations', 'residual', 'x'])
+        for name, status, iters, residual, x in results:
+            solution = '' if x is None else ' '.join(repr(float(v)) for v in x)
+            writer.writerow([name, status, iters, repr(residual), solution])
+
+
+WRITERS = {
+    '.npz': write_npz,
+    '.csv': write_csv,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Пакетне розв'язання СЛАР з файлів без графічного інтерфейсу")
+    parser.add_argument('inputs', nargs='+', help="файли .npy, .npz, .csv або .mtx")
+    parser.add_argument('-o', '--output', required=True, help="файл результатів .npz або .csv")
+    parser.add_argument('-m', '--method', choices=list(METHODS), default='gauss')
+    parser.add_argument('--eps', type=float, default=1e-8, help="точність ітераційних методів")
+    parser.add_argument('--max-iter', type=int, default=20000)
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    out_ext = os.path.splitext(args.output)[1].lower()
+    if out_ext not in WRITERS:
+        parser.error(f"формат результатів має бути одним з: {', '.join(WRITERS)}")
+    systems = read_systems(args.inputs)
+    if not systems:
+        parser.error("не знайдено жодної системи")
+
+    tasks = [(name, source, args.method, args.eps, args.max_iter) for name, source in systems]
+    start = time.perf_counter()
+    if args.workers <= 1:
+        results = [solve_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            # Дрібні системи віддаються пачками, щоб не платити за пересилання кожної окремо
+            chunk = max(1, len(tasks) // (4 * args.workers))
+            results = list(pool.map(solve_task, tasks, chunksize=chunk))
+    elapsed = time.perf_counter() - start
+
+    WRITERS[out_ext](args.output, results)
+    failed = sum(1 for r in results if r[4] is None or r[1] not in ('solved', 'converged'))
+    print(f"Розв'язано систем: {len(results)} за {elapsed:.2f} с ({args.method}, процесів: {args.workers}); "
+          f"без розв'язку або без збіжності: {failed}. Результати: {args.output}")
+    return 0 if failed == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
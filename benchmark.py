@@ -0,0 +1,379 @@
+import importlib.util
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_script(file_name, module_name):
+    # Файли практичних робіт мають пробіли в назвах, тому імпортуються за шляхом
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(ROOT, file_name))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    value = fn(*args, **kwargs)
+    return value, time.perf_counter() - start
+
+
+def banded_system(n, shift=0.5):
+    # П'ятидіагональна матриця, як у дискретизованому рівнянні Пуассона: зсуви ±1 та ±sqrt(n)
+    k = max(2, int(round(np.sqrt(n))))
+    rows, cols, vals = [np.arange(n)], [np.arange(n)], [np.full(n, 4.0 + shift)]
+    for offset in (1, k):
+        i = np.arange(n - offset)
+        rows += [i, i + offset]
+        cols += [i + offset, i]
+        vals += [np.full(n - offset, -1.0)] * 2
+    return np.concatenate(rows), np.concatenate(cols), np.concatenate(vals), np.ones(n)
+
+
+def legacy_gauss_seidel(A, b, eps, max_iter):
+    # Попередня реалізація: цикл по рядках з копією x на кожній ітерації
+    n = A.shape[0]
+    x = b.copy()
+    for k in range(1, max_iter + 1):
+        x_new = x.copy()
+        for i in range(n):
+            s1 = A[i, :i].dot(x_new[:i])
+            s2 = A[i, i + 1:].dot(x[i + 1:])
+            x_new[i] = (b[i] - s1 - s2) / A[i, i]
+        if np.max(np.abs(x_new - x)) < eps:
+            return x_new, k
+        x = x_new
+    return x, max_iter
+
+
+def bench_seidel(eps=1e-8, max_iter=10000, dense_limit=2000):
+    slr = load_script("PR 2.py", "pr2")
+    print("Метод Зейделя: час, с (ітерацій)")
+    print(f"{'n':>7} {'щільний, рядки':>16} {'щільний, блоки':>16} {'CSR, рядки':>16} {'CSR, кольори':>16}")
+    for n in (100, 1000, 10000):
+        rows, cols, vals, b = banded_system(n)
+        A = slr.CSRMatrix.from_coo(rows, cols, vals, (n, n))
+        cells = []
+        if n <= dense_limit:
+            dense = A.toarray()
+            (_, k), t = timed(legacy_gauss_seidel, dense, b, eps, max_iter)
+            cells.append(f"{t:.3f} ({k})")
+            (_, k, _), t = timed(slr.gauss_seidel_blocked, dense, b, eps=eps, max_iter=max_iter)
+            cells.append(f"{t:.3f} ({k})")
+        else:
+            cells += ["—", "—"]
+        (_, k, _), t = timed(slr.gauss_seidel, A, b, eps=eps, max_iter=max_iter, ordering='natural')
+        cells.append(f"{t:.3f} ({k})")
+        (_, k, _), t = timed(slr.gauss_seidel, A, b, eps=eps, max_iter=max_iter)
+        cells.append(f"{t:.3f} ({k})")
+        print(f"{n:>7} " + " ".join(f"{c:>16}" for c in cells))
+
+
+def legacy_gauss_method(A, B):
+    # Попередня реалізація work.gauss_method: повне виключення на кожен виклик
+    n = len(B)
+    A = A.astype(float)
+    B = B.astype(float)
+    for i in range(n):
+        if A[i][i] == 0:
+            for j in range(i + 1, n):
+                if A[j][i] != 0:
+                    A[[i, j]] = A[[j, i]]
+                    B[[i, j]] = B[[j, i]]
+                    break
+        pivot = A[i][i]
+        A[i] = A[i] / pivot
+        B[i] = B[i] / pivot
+        for j in range(i + 1, n):
+            factor = A[j][i]
+            A[j] = A[j] - factor * A[i]
+            B[j] = B[j] - factor * B[i]
+    x = np.zeros(n)
+    for i in range(n - 1, -1, -1):
+        x[i] = B[i] - np.dot(A[i, i + 1:], x[i + 1:])
+    return x
+
+
+def bench_lu(repeats=20):
+    work = load_script("work.py", "work")
+    rng = np.random.default_rng(0)
+    print("LU-розклад з кешем: час одного розв'язку, мс")
+    print(f"{'n':>6} {'старий Гаусс':>13} {'LU, перший':>11} {'LU, з кешу':>11} {'похибка':>10}")
+    for n in (50, 100, 300):
+        A = rng.random((n, n))
+        b = rng.random(n)
+        _, t_old = timed(lambda: [legacy_gauss_method(A, b) for _ in range(repeats)])
+        work.LU_CACHE.clear()
+        _, t_first = timed(work.gauss_method, A, b)
+        _, t_cached = timed(lambda: [work.gauss_method(A, rng.random(n)) for _ in range(repeats)])
+        err = np.abs(work.gauss_method(A, b) - np.linalg.solve(A, b)).max()
+        print(f"{n:>6} {t_old / repeats * 1e3:>13.3f} {t_first * 1e3:>11.3f} "
+              f"{t_cached / repeats * 1e3:>11.3f} {err:>10.1e}")
+
+
+def bench_blocked_lu(legacy_limit=1000):
+    work = load_script("work.py", "work")
+    rng = np.random.default_rng(0)
+    print("Виключення Гаусса для великих щільних систем: час, с")
+    print(f"{'n':>6} {'по рядках':>10} {'по стовпцях':>12} {'блоками':>9} {'LAPACK':>8} {'похибка':>10}")
+    for n in (500, 1000, 2000):
+        A = rng.random((n, n))
+        b = rng.random(n)
+        t_legacy = timed(legacy_gauss_method, A, b)[1] if n <= legacy_limit else None
+        # Блок на всю ширину — попередня версія: оновлення рангу 1 після кожного стовпця
+        _, t_rank1 = timed(work.LUFactorization, A, n)
+        lu, t_blocked = timed(work.LUFactorization, A)
+        _, t_lapack = timed(np.linalg.solve, A, b)
+        err = np.abs(lu.solve(b) - np.linalg.solve(A, b)).max()
+        legacy = f"{t_legacy:.3f}" if t_legacy is not None else "—"
+        print(f"{n:>6} {legacy:>10} {t_rank1:>12.3f} {t_blocked:>9.3f} {t_lapack:>8.3f} {err:>10.1e}")
+
+
+def bench_cramer():
+    work = load_script("work.py", "work")
+    rng = np.random.default_rng(0)
+    print("Метод Крамера: n + 1 визначників проти одного LU-розкладу з поправками рангу 1")
+    print(f"{'n':>5} {'повний, с':>10} {'з поправками, с':>16} {'прискорення':>12} {'різниця':>10} {'вивід':>7}")
+    for n in (10, 100, 500):
+        A = rng.random((n, n)) + np.eye(n)
+        b = rng.random(n)
+        work.LU_CACHE.clear()
+        x_full, t_full = timed(work.cramer_method, A, b, "full")
+        work.LU_CACHE.clear()
+        x_update, t_update = timed(work.cramer_method, A, b, "update")
+        same = "так" if np.array2string(x_full) == np.array2string(x_update) else "ні"
+        print(f"{n:>5} {t_full:>10.4f} {t_update:>16.4f} {t_full / t_update:>11.0f}x "
+              f"{np.abs(x_full - x_update).max():>10.1e} {same:>7}")
+
+
+def bench_multi_rhs(k=100, eps=1e-8, max_iter=10000):
+    work = load_script("work.py", "work")
+    slr = load_script("PR 2.py", "pr2")
+    rng = np.random.default_rng(0)
+    n_direct = 100
+    A_direct = rng.random((n_direct, n_direct)) + n_direct * np.eye(n_direct)
+    rows, cols, vals, _ = banded_system(2500)
+    A_sparse = slr.CSRMatrix.from_coo(rows, cols, vals, (2500, 2500))
+    A_dense = slr.CSRMatrix.from_coo(*banded_system(400)[:3], (400, 400)).toarray()
+    cases = [
+        ("Крамер", work.cramer_method, A_direct, {}),
+        ("Гаусс", work.gauss_method, A_direct, {}),
+        ("Обернена матриця", work.inverse_matrix_method, A_direct, {}),
+        ("Якобі, щільна", slr.jacobi_method, A_dense, dict(eps=eps, max_iter=max_iter)),
+        ("Зейдель, щільна", slr.gauss_seidel, A_dense, dict(eps=eps, max_iter=max_iter)),
+        ("Якобі, CSR", slr.jacobi_method, A_sparse, dict(eps=eps, max_iter=max_iter)),
+        ("Зейдель, CSR", slr.gauss_seidel, A_sparse, dict(eps=eps, max_iter=max_iter)),
+        ("SSOR, CSR", slr.ssor_method, A_sparse, dict(eps=eps, max_iter=max_iter)),
+    ]
+    print(f"Кілька правих частин: k = {k}, розв'язків за секунду")
+    print(f"{'метод':>18} {'n':>6} {'по одній':>10} {'пакетом':>10} {'прискорення':>12}")
+    for name, solver, A, options in cases:
+        B = rng.random((A.shape[0], k))
+        _, t_loop = timed(lambda: [solver(A, B[:, j], **options) for j in range(k)])
+        _, t_batch = timed(solver, A, B, **options)
+        print(f"{name:>18} {A.shape[0]:>6} {k / t_loop:>10.1f} {k / t_batch:>10.1f} {t_loop / t_batch:>11.1f}x")
+
+
+def bench_diagnostics(eps=1e-10, max_iter=20000):
+    slr = load_script("PR 2.py", "pr2")
+    rng = np.random.default_rng(0)
+    M = rng.random((300, 300))
+    rows, cols, vals, b_banded = banded_system(2500)
+    cases = [
+        ("смугова, діаг. перевага", slr.CSRMatrix.from_coo(rows, cols, vals, (2500, 2500)), b_banded),
+        ("випадкова без переваги", M + np.eye(300), rng.random(300)),
+        ("симетрична додатно визначена", M @ M.T + np.eye(300), rng.random(300)),
+    ]
+    print(f"Діагностика збіжності (ліміт {max_iter} ітерацій): час, с (ітерацій)")
+    residual = "нев'язка"
+    print(f"{'система':>30} {'метод':>8} {'без діагностики':>17} {residual:>10} {'з діагностикою':>16} "
+          f"{'rho':>8} {'стан':>10}")
+    for name, A, b in cases:
+        for method_name, solver in (("Якобі", slr.jacobi_method), ("Зейдель", slr.gauss_seidel)):
+            with np.errstate(all='ignore'):
+                (_, k_plain, rnorm), t_plain = timed(solver, A, b, eps=eps, max_iter=max_iter)
+                (_, k, _, monitor), t = timed(solver, A, b, eps=eps, max_iter=max_iter, diagnostics=True)
+            print(f"{name:>30} {method_name:>8} {f'{t_plain:.3f} ({k_plain})':>17} {rnorm:>10.2e} "
+                  f"{f'{t:.3f} ({k})':>16} {monitor.spectral_radius:>8.3f} {monitor.status:>10}")
+
+
+def bench_root_scan(samples=10001, eps=1e-10):
+    from sympy import symbols, sympify, lambdify
+    roots_gui = load_script("PR 4.py", "pr4")
+    x = symbols("x")
+    print(f"Пошук усіх коренів: сітка {samples} точок, точність {eps}")
+    print(f"{'f(x)':>24} {'коренів':>8} {'скалярно, с':>12} {'векторно, с':>12} {'прискорення':>12}")
+    for func_str, a, b in (("x**3 - 2*x + 1", -10, 10), ("sin(50*x)*exp(-x/5)", 0, 10),
+                           ("cos(x**2)", 0, 30)):
+        f = lambdify(x, sympify(func_str), "numpy")
+
+        def scalar_scan():
+            # Те саме поелементно: скалярний прохід по сітці і bisection_method на кожен відрізок
+            xs = np.linspace(a, b, samples)
+            ys = [f(float(v)) for v in xs]
+            return [roots_gui.bisection_method(xs[i], xs[i + 1], f, eps)[-1][2]
+                    for i in range(samples - 1) if ys[i] * ys[i + 1] < 0]
+
+        _, t_scalar = timed(scalar_scan)
+        roots, t_vector = timed(roots_gui.find_all_roots, f, a, b, samples, eps)
+        print(f"{func_str:>24} {len(roots):>8} {t_scalar:>12.3f} {t_vector:>12.4f} {t_scalar / t_vector:>11.0f}x")
+
+
+def bench_param_sweep(eps=1e-10, max_calls=10 ** 4):
+    sweep = load_script("PR 3.py", "pr3")
+
+    def scalar_newton(c, x0=-1.5):
+        # Скалярний Ньютон з PR 3.py, але з параметром c замість глобальної f
+        while True:
+            x1 = x0 - sweep.cubic(x0, c) / sweep.cubic_der(x0, c)
+            if abs(x1 - x0) < eps:
+                return x1
+            x0 = x1
+
+    print("Ньютон для x^3 + 2x^2 + 3x + c = 0 по вектору параметрів c: розв'язків за секунду")
+    print(f"{'кількість c':>12} {'по одному':>12} {'пакетом':>12} {'прискорення':>12}")
+    for n in (10 ** 4, 10 ** 5, 10 ** 6):
+        c = np.linspace(1, 10, n)
+        # Скалярна версія міряється на підвибірці, інакше бенчмарк триває хвилини
+        calls = min(n, max_calls)
+        _, t_scalar = timed(lambda: [scalar_newton(float(v)) for v in c[:calls]])
+        (_, _, status), t_batch = timed(sweep.newton_batch, sweep.cubic, sweep.cubic_der, -1.5, c, eps)
+        assert np.all(status == sweep.CONVERGED)
+        rate_scalar, rate_batch = calls / t_scalar, n / t_batch
+        print(f"{n:>12} {rate_scalar:>12.0f} {rate_batch:>12.0f} {rate_batch / rate_scalar:>11.0f}x")
+
+
+def bench_root_methods(eps=1e-3):
+    from sympy import symbols, sympify, lambdify
+    roots_gui = load_script("PR 4.py", "pr4")
+    x = symbols("x")
+    methods = ("Бісекція", "Ньютона", "Хорд", "Брента")
+    print(f"Кількість обчислень f (+ f' для Ньютона) до точності {eps}; '—' — метод не дав результату")
+    print(f"{'f(x)':>16} {'[a, b]':>10}" + "".join(f"{m:>12}" for m in methods))
+    for func_str, a, b in (("x**3 - 2*x + 1", -3, 0), ("cos(x) - x", 0, 1), ("exp(x) - 10", 0, 5),
+                           ("atan(x)", -10, 30), ("(x - 1)**3", 0, 5)):
+        expr = sympify(func_str)
+        f, f_der = lambdify(x, expr, "numpy"), lambdify(x, expr.diff(), "numpy")
+        cells = []
+        for method in methods:
+            f_counted, der_counted = roots_gui.CountingFunction(f), roots_gui.CountingFunction(f_der)
+            with np.errstate(all="ignore"):
+                steps = roots_gui.run_method(method, a, b, f_counted, der_counted)
+            root = steps[-1][-2] if steps else None
+            # Розбіжність (Ньютон і хорди на atan) теж позначається прочерком
+            if root is None or abs(f(root)) > 1e-2:
+                cells.append("—")
+            else:
+                cells.append(f"{f_counted.calls + der_counted.calls}")
+        print(f"{func_str:>16} {f'[{a}, {b}]':>10}" + "".join(f"{c:>12}" for c in cells))
+
+
+def bench_step_navigation(eps=1e-15, clicks=30):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from sympy import symbols, sympify, lambdify
+    roots_gui = load_script("PR 4.py", "pr4")
+    x = symbols("x")
+    expr = sympify("x**3 - 2*x + 1")
+    f = lambdify(x, expr, "numpy")
+    steps = roots_gui.bisection_method(-3, 0, f, eps)
+    as_tuples = [steps[k] for k in range(len(steps))]
+    list_bytes = sys.getsizeof(as_tuples) + sum(sys.getsizeof(t) + sum(sys.getsizeof(v) for v in t)
+                                               for t in as_tuples)
+    print(f"Історія бісекції, {len(steps)} кроків: список кортежів {list_bytes} Б, "
+          f"StepBuffer {steps.data.nbytes} Б")
+
+    def legacy_click(k):
+        # Старий draw_step: lambdify, 500 точок, очищення і повна перебудова графіка
+        plt.style.use("dark_background")
+        plt.clf()
+        ax = plt.gca()
+        xs = np.linspace(-10, 10, 500)
+        ax.plot(xs, lambdify(x, expr, "numpy")(xs), color="#00eaff", linewidth=2)
+        ax.axhline(0, color="white", linewidth=0.8)
+        a, b, z, i = steps[k % len(steps)]
+        ax.scatter([a, b, z], [0, 0, 0], color="red")
+        ax.set_title(f"Ітерація {i} — x = {z:.6f}", color="white")
+        ax.grid(color="#444444")
+        plt.gcf().canvas.draw()
+
+    with plt.style.context("dark_background"):
+        fig = Figure(figsize=(7, 5))
+        ax = fig.add_subplot()
+        xs = np.linspace(-10, 10, 500)
+        ax.plot(xs, roots_gui.sample_function(f, xs), color="#00eaff", linewidth=2)
+        markers = ax.scatter([], [], color="red", zorder=3)
+        title = ax.set_title("", color="white")
+    canvas = FigureCanvasAgg(fig)
+
+    def click(k):
+        a, b, z, i = steps[k % len(steps)]
+        markers.set_offsets(np.column_stack([[a, b, z], np.zeros(3)]))
+        title.set_text(f"Ітерація {i} — x = {z:.6f}")
+        canvas.draw()
+
+    _, t_legacy = timed(lambda: [legacy_click(k) for k in range(clicks)])
+    _, t_new = timed(lambda: [click(k) for k in range(clicks)])
+    print(f"Перехід між кроками (рендер Agg): {1000 * t_legacy / clicks:.1f} мс -> {1000 * t_new / clicks:.1f} мс "
+          f"({t_legacy / t_new:.1f}x)")
+    plt.close("all")
+
+
+def legacy_fixed_point(phi, x0, eps, max_iter=1000):
+    # Цикл старого solve_iteration з PR 5.py: numpy-функція і порівняння через SymPy Abs
+    from sympy import Abs
+    x_curr, iterations = x0, 0
+    while True:
+        x_next = phi(x_curr)
+        iterations += 1
+        if Abs(x_next - x_curr) <= eps:
+            return x_next, iterations
+        x_curr = x_next
+        if iterations > max_iter:
+            return None, iterations
+
+
+def bench_fixed_point(eps=1e-12, repeats=200):
+    from sympy import symbols, sympify, lambdify
+    iteration = load_script("PR 5.py", "pr5")
+    x = symbols("x")
+    print(f"Метод ітерацій x = phi(x), точність {eps}: ітерацій / обчислень phi / час одного розв'язку")
+    for phi_str, x0 in (("1.25*(1 + log(x))", 2.2), ("cos(x)", 0.5), ("exp(-x)", 1.0)):
+        expr = sympify(phi_str)
+        phi_numpy, phi_math = lambdify(x, expr, "numpy"), lambdify(x, expr, "math")
+        (_, iters), t = timed(lambda: [legacy_fixed_point(phi_numpy, x0, eps) for _ in range(repeats)][-1])
+        print(f"  phi = {phi_str}, x0 = {x0}")
+        print(f"    {'старий цикл (Abs)':<20} {iters:>5} {iters:>5} {1e6 * t / repeats:>9.1f} мкс")
+        for method, name in iteration.FIXED_POINT_METHODS.items():
+            result, t = timed(lambda: [iteration.fixed_point(phi_math, x0, eps, method) for _ in range(repeats)][-1])
+            _, iters, evals, _, error = result
+            assert error is None, error
+            print(f"    {name:<20} {iters:>5} {evals:>5} {1e6 * t / repeats:>9.1f} мкс")
+
+
+BENCHMARKS = {
+    "seidel": bench_seidel,
+    "multi_rhs": bench_multi_rhs,
+    "lu": bench_lu,
+    "cramer": bench_cramer,
+    "blocked_lu": bench_blocked_lu,
+    "diagnostics": bench_diagnostics,
+    "root_scan": bench_root_scan,
+    "param_sweep": bench_param_sweep,
+    "root_methods": bench_root_methods,
+    "step_navigation": bench_step_navigation,
+    "fixed_point": bench_fixed_point,
+}
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        BENCHMARKS[name]()
+        print()
@@ -0,0 +1,147 @@
+import multiprocessing
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+
+import eel
+
+# Спільні частини застосунків IntegrationMethods і ProjectFolder: планувальник обчислень
+# у процесах, які можна вбити, і кеш графіків, що малюються у фоновому пулі процесів
+
+
+def _worker_loop(conn):
+    # Постійний процес-працівник: отримує (fn, args, stream) і надсилає ("progress", дані)
+    # для проміжних результатів і ("done", (ok, значення)) в кінці кожного завдання
+    while True:
+        try:
+            fn, args, stream = conn.recv()
+        except EOFError:
+            return
+        try:
+            if stream:
+                value = fn(*args, report=lambda item: conn.send(("progress", item)))
+            else:
+                value = fn(*args)
+            conn.send(("done", (True, value)))
+        except Exception as e:
+            conn.send(("done", (False, str(e))))
+
+
+class JobScheduler:
+    # Обчислення виконуються в max_workers заздалегідь запущених процесах, одночасно не більше max_workers.
+    # Під spawn (Windows, macOS) новий процес заново імпортує numpy, matplotlib і eel, тож процеси
+    # перевикористовуються між запитами. Процес можна вбити, тож працюють і тайм-аут, і скасування
+    # з браузера; замість убитого або аварійного процесу запускається новий.
+    def __init__(self, max_workers=4, max_queue=16, timeout=60):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.running = set()
+        self.queue = deque()
+        self.cancelled = set()
+        self.idle = []
+
+    def start_worker(self):
+        parent, child = multiprocessing.Pipe()
+        process = multiprocessing.Process(target=_worker_loop, args=(child,), daemon=True)
+        process.start()
+        child.close()
+        return process, parent
+
+    def start(self):
+        while len(self.idle) + len(self.running) < self.max_workers:
+            self.idle.append(self.start_worker())
+
+    def run(self, job_id, fn, *args, on_progress=None):
+        if len(self.queue) >= self.max_queue:
+            return False, "Черга обчислень переповнена, спробуйте пізніше"
+
+        # Виклики eel виконуються в greenlet-ах одного потоку, тож лічильники не потребують блокувань
+        self.queue.append(job_id)
+        try:
+            while self.queue[0] != job_id or len(self.running) >= self.max_workers:
+                if job_id in self.cancelled:
+                    self.cancelled.discard(job_id)
+                    return False, "Обчислення скасовано"
+                eel.sleep(0.05)
+        finally:
+            self.queue.remove(job_id)
+
+        self.start()
+        self.running.add(job_id)
+        process, conn = self.idle.pop()
+        finished = False
+        try:
+            conn.send((fn, args, on_progress is not None))
+            deadline = time.monotonic() + self.timeout
+            while True:
+                while not conn.poll():
+                    if job_id in self.cancelled:
+                        return False, "Обчислення скасовано"
+                    if time.monotonic() > deadline:
+                        return False, f"Перевищено час обчислення ({self.timeout} с)"
+                    if not process.is_alive() and not conn.poll():
+                        return False, "Процес обчислення завершився аварійно"
+                    eel.sleep(0.02)
+                try:
+                    kind, payload = conn.recv()
+                except EOFError:
+                    return False, "Процес обчислення завершився аварійно"
+                if kind == "done":
+                    finished = True
+                    return payload
+                on_progress(payload)
+        finally:
+            if finished:
+                self.idle.append((process, conn))
+            else:
+                # Перерване завдання не можна зупинити інакше, ніж убивши процес
+                if process.is_alive():
+                    process.kill()
+                process.join()
+                conn.close()
+                self.idle.append(self.start_worker())
+            self.running.discard(job_id)
+            self.cancelled.discard(job_id)
+
+    def cancel(self, job_id):
+        if job_id in self.running or job_id in self.queue:
+            self.cancelled.add(job_id)
+
+
+class PlotCache:
+    # Графік залежить лише від (вираз, a, b), тож зміна n не перемальовує його.
+    # normalize зводить однакові вирази з різним записом до одного ключа.
+    def __init__(self, render, normalize=str.strip, size=64, workers=2):
+        self.render = render
+        self.normalize = normalize
+        self.size = size
+        self.workers = workers
+        self.futures = OrderedDict()
+        self.pool = None
+
+    def request(self, func_str, a, b):
+        expr = self.normalize(func_str)
+        plot_key = f"{expr}|{a!r}|{b!r}"
+        if plot_key in self.futures:
+            self.futures.move_to_end(plot_key)
+        else:
+            if self.pool is None:
+                self.pool = ProcessPoolExecutor(max_workers=self.workers)
+            self.futures[plot_key] = self.pool.submit(self.render, expr, a, b)
+            if len(self.futures) > self.size:
+                self.futures.popitem(last=False)
+        return plot_key
+
+    def get(self, plot_key):
+        future = self.futures.get(plot_key)
+        if future is None:
+            return {"image": None, "error": "Графік не знайдено"}
+        # Очікування через eel.sleep не блокує обробку інших викликів
+        while not future.done():
+            eel.sleep(0.05)
+        try:
+            return {"image": future.result(), "error": None}
+        except Exception as e:
+            self.futures.pop(plot_key, None)
+            return {"image": None, "error": str(e)}
@@ -0,0 +1,88 @@
+import importlib.util
+import math
+import os
+import warnings
+
+import numpy as np
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_script(file_name, module_name):
+    # Файли практичних робіт мають пробіли в назвах, тому імпортуються за шляхом
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(ROOT, file_name))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+pr2 = load_script("PR 2.py", "pr2")
+work = load_script("work.py", "work")
+
+
+def test_gauss_seidel_nan_is_not_convergence():
+    # Недомінантна матриця: ітерації Зейделя розбігаються до inf/nan
+    A = np.random.default_rng(0).random((300, 300)) + np.eye(300)
+    b = np.ones(300)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        _, k, rnorm = pr2.gauss_seidel(A, b, eps=1e-8, max_iter=1000)
+        assert k < 1000 and not np.isfinite(rnorm)
+        for ordering in ("multicolor", "natural"):
+            _, k, rnorm = pr2.gauss_seidel(pr2.CSRMatrix.from_dense(A), b, eps=1e-8, max_iter=1000,
+                                           ordering=ordering)
+            assert k < 1000 and not np.isfinite(rnorm)
+        assert pr2.gauss_seidel(A, b, eps=1e-8, diagnostics=True)[3].status == 'diverged'
+        _, _, rnorm = pr2.gauss_seidel([[1.0, 3.0], [3.0, 1.0]], [1.0, 1.0], eps=1e-8)
+        assert not np.isfinite(rnorm)
+
+
+def test_max_change_keeps_nan():
+    nan = float("nan")
+    assert math.isnan(pr2.max_change([1.0, nan], [0.0, 0.0]))
+    assert math.isnan(pr2.max_change([nan, 1.0], [0.0, 0.0]))
+    assert pr2.max_change([1.0, -2.0], [0.0, 0.0]) == 2.0
+
+
+def test_krylov_zero_iterations():
+    A = np.array([[4.0, 1.0], [1.0, 3.0]])
+    b = np.array([1.0, 2.0])
+    for solver in (pr2.cg_method, pr2.bicgstab_method):
+        x, k, _ = solver(A, b, max_iter=0)
+        assert k == 0 and np.all(x == 0)
+        x, _, rnorm = solver(A, b, eps=1e-12)
+        assert rnorm < 1e-10
+
+
+def test_krylov_breakdown_is_reported():
+    # Незнаковизначена матриця: уже на першому кроці p·Ap = 0
+    with pytest.raises(ValueError, match="CG"):
+        pr2.cg_method([[1.0, 0.0], [0.0, -1.0]], [1.0, 1.0])
+    # Перестановка: v = A r ортогональний до r̂ = r
+    with pytest.raises(ValueError, match="BiCGSTAB"):
+        pr2.bicgstab_method([[0.0, 1.0], [1.0, 0.0]], [1.0, 0.0])
+
+
+def test_lu_pivot_tolerance_is_relative():
+    # Погано масштабовані, але невироджені матриці не вважаються виродженими
+    for A in (np.diag([1e10, 1e-10]), [[1e10, 1e10], [1e-10, 2e-10]]):
+        lu = work.LUFactorization(A)
+        assert not lu.singular
+        assert lu.determinant() == pytest.approx(np.linalg.det(A))
+        assert np.allclose(lu.solve(np.dot(A, [1.0, 1.0])), [1.0, 1.0])
+    # Шум округлення на місці нульового опорного елемента — вироджена матриця
+    lu = work.LUFactorization([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0]])
+    assert lu.singular and lu.determinant() == 0.0
+    with pytest.raises(ValueError):
+        lu.solve([1.0, 2.0, 3.0])
+
+
+def test_diagnostics_allow_transient_growth():
+    # Матриця ітерацій нільпотентна (rho = 0), але за перші ітерації поправки ростуть як 1.5^k
+    A = np.eye(60) + 1.5 * np.eye(60, k=1)
+    b = np.ones(60)
+    for solver in (pr2.jacobi_method, pr2.gauss_seidel):
+        x, k, rnorm, monitor = solver(A, b, eps=1e-10, diagnostics=True)
+        assert monitor.status == 'converged' and k > 0
+        assert np.allclose(x, np.linalg.solve(A, b))
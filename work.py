@@ -1,3 +1,6 @@
+import hashlib
+from collections import OrderedDict
+
 import numpy as np
 
 A = np.array([
@@ -8,79 +11,200 @@ A = np.array([
 
 B = np.array([6, 14, 20], dtype=float)
 
+# LU FACTORIZATION WITH PARTIAL PIVOTING: P A = L U
+# L (UNIT DIAGONAL) AND U ARE STORED TOGETHER IN ONE MATRIX
+LU_BLOCK = 64
+
+
+class LUFactorization:
+    def __init__(self, A, block=LU_BLOCK):
+        # BLOCKED RIGHT-LOOKING ELIMINATION, ALL IN PLACE IN ONE ARRAY:
+        # 1) PANEL OF block COLUMNS IS ELIMINATED COLUMN BY COLUMN (ROW SWAPS ARE APPLIED TO FULL ROWS)
+        # 2) BLOCK ROW OF U TO THE RIGHT OF THE PANEL: U12 = L11^-1 A12
+        # 3) TRAILING SUBMATRIX GETS ONE RANK-block UPDATE: A22 -= L21 @ U12 (A SINGLE MATRIX PRODUCT)
+        A = np.asarray(A, dtype=float)
+        LU = A.copy()
+        n = LU.shape[0]
+        self.perm = np.arange(n)
+        self.sign = 1.0
+        self.singular = False
+        # A PIVOT THAT IS ONLY ROUNDING NOISE (E.G. 1e-16 FOR [[1,2,3],[4,5,6],[7,8,9]]) MEANS A SINGULAR MATRIX.
+        # THE ROUNDING ERROR OF A PIVOT IS AT MOST ~ n * eps * (|a_pi| + |l_p| . |u_i|), SO EACH PIVOT IS MEASURED
+        # AGAINST ITS OWN ENTRY AND UPDATES, NOT AGAINST max|A|: BADLY SCALED BUT REGULAR MATRICES
+        # LIKE diag(1e10, 1e-10) ARE NOT REJECTED
+        noise = n * np.finfo(float).eps
+        row = np.empty(n)
+        for s in range(0, n, block):
+            e = min(s + block, n)
+            for i in range(s, e):
+                # THE LARGEST ELEMENT OF THE COLUMN BECOMES THE PIVOT
+                p = i + int(np.argmax(np.abs(LU[i:, i])))
+                scale = abs(A[self.perm[p], i]) + np.abs(LU[p, :i]).dot(np.abs(LU[:i, i]))
+                if abs(LU[p, i]) <= noise * scale:
+                    self.singular = True
+                    continue
+                if p != i:
+                    row[:] = LU[i]
+                    LU[i] = LU[p]
+                    LU[p] = row
+                    self.perm[i], self.perm[p] = self.perm[p], self.perm[i]
+                    self.sign = -self.sign
+                LU[i + 1:, i] /= LU[i, i]
+                LU[i + 1:, i + 1:e] -= np.outer(LU[i + 1:, i], LU[i, i + 1:e])
+            if e < n:
+                L11 = np.tril(LU[s:e, s:e], -1) + np.eye(e - s)
+                LU[s:e, e:] = np.linalg.solve(L11, LU[s:e, e:])
+                LU[e:, e:] -= LU[e:, s:e] @ LU[s:e, e:]
+        self.LU = LU
+        self._inverse = None
+
+    def determinant(self):
+        if self.singular:
+            return 0.0
+        return self.sign * float(np.prod(np.diag(self.LU)))
+
+    def solve(self, B):
+        # FORWARD SUBSTITUTION L y = P B, THEN BACK SUBSTITUTION U x = y
+        if self.singular:
+            raise ValueError("MATRIX IS SINGULAR")
+        LU = self.LU
+        n = LU.shape[0]
+        y = np.array(B, dtype=float)[self.perm]
+        for i in range(1, n):
+            y[i] -= np.dot(LU[i, :i], y[:i])
+        for i in range(n - 1, -1, -1):
+            y[i] = (y[i] - np.dot(LU[i, i + 1:], y[i + 1:])) / LU[i, i]
+        return y
+
+    def inverse(self):
+        if self._inverse is None:
+            self._inverse = self.solve(np.eye(self.LU.shape[0]))
+        return self._inverse
+
+
+# FACTORIZATIONS ARE CACHED BY A HASH OF THE MATRIX CONTENTS
+LU_CACHE = OrderedDict()
+LU_CACHE_SIZE = 16
+
+
+def lu_factor(A):
+    A = np.ascontiguousarray(A, dtype=float)
+    key = (A.shape, hashlib.sha1(A.tobytes()).hexdigest())
+    if key in LU_CACHE:
+        LU_CACHE.move_to_end(key)
+    else:
+        LU_CACHE[key] = LUFactorization(A)
+        if len(LU_CACHE) > LU_CACHE_SIZE:
+            LU_CACHE.popitem(last=False)
+    return LU_CACHE[key]
+
+
 # METHOD OF CRAMER
-def cramer_method(A, B):
-    det_A = np.linalg.det(A)
+# B CAN BE A VECTOR OR AN N x K MATRIX (ONE RIGHT-HAND SIDE PER COLUMN)
+CRAMER_STACK_BYTES = 64 * 2 ** 20
+
+
+def cramer_determinants(A, B, mode="update"):
+    # RETURNS det(A) AND det(A_i) FOR EVERY COLUMN i (AND EVERY RIGHT-HAND SIDE)
+    # mode="update": A IS FACTORED ONCE; A_i = A + (b - a_i) e_i^T IS A RANK-ONE CHANGE, SO
+    #   det(A_i) = det(A) * (1 + e_i^T A^-1 (b - a_i)) = det(A) * (A^-1 b)_i
+    # mode="full": EVERY A_i IS BUILT AND ITS DETERMINANT IS COMPUTED FROM SCRATCH
+    lu = lu_factor(A)
+    det_A = lu.determinant()
+    B = np.asarray(B, dtype=float)
+    if det_A == 0:
+        return det_A, None
+    if mode == "update":
+        return det_A, det_A * lu.solve(B)
+    if mode != "full":
+        raise ValueError("UNKNOWN CRAMER MODE: " + str(mode))
+
+    A = np.asarray(A, dtype=float)
+    cols = B.reshape(len(B), -1)
+    n, k = cols.shape
+    # ALL MATRICES A_i GO TO np.linalg.det AS STACKS OF LIMITED SIZE
+    det_Ai = np.empty(n * k)
+    chunk = max(1, CRAMER_STACK_BYTES // (8 * n * n))
+    for start in range(0, n * k, chunk):
+        idx = np.arange(start, min(start + chunk, n * k))
+        i, j = idx // k, idx % k
+        Ai = np.repeat(A[np.newaxis], len(idx), axis=0)
+        Ai[np.arange(len(idx)), :, i] = cols[:, j].T
+        det_Ai[idx] = np.linalg.det(Ai)
+    return det_A, det_Ai.reshape(B.shape)
+
+
+def cramer_method(A, B, mode="update"):
+    det_A, det_Ai = cramer_determinants(A, B, mode)
     if det_A == 0:
         print("ERROR: DETERMINANT = 0, SYSTEM HAS NO UNIQUE SOLUTION.")
         return None
+    return det_Ai / det_A
 
-    n = len(B)
-    result = []
+# STEP-BY-STEP ELIMINATION OF THE AUGMENTED MATRIX [A | B] FOR PRINTING.
+# IT IS A GENERATOR: NOTHING IS COMPUTED OR COPIED UNTIL THE STEPS ARE ITERATED.
+def gauss_elimination_steps(A, B):
+    M = np.column_stack([np.array(A, dtype=float), np.array(B, dtype=float)])
+    n = M.shape[0]
     for i in range(n):
-        Ai = np.copy(A)
-        Ai[:, i] = B
-        det_Ai = np.linalg.det(Ai)
-        result.append(det_Ai / det_A)
-    return np.array(result)
-
-# GAUSS METHOD
-def gauss_method(A, B):
-    n = len(B)
-    A = A.astype(float)
-    B = B.astype(float)
-
-    for i in range(n):
-        if A[i][i] == 0:
-            for j in range(i + 1, n):
-                if A[j][i] != 0:
-                    A[[i, j]] = A[[j, i]]
-                    B[i], B[j] = B[j], B[i]
-                    break
-
-        pivot = A[i][i]
-        A[i] = A[i] / pivot
-        B[i] = B[i] / pivot
+        p = i + int(np.argmax(np.abs(M[i:, i])))
+        if M[p, i] == 0:
+            continue
+        if p != i:
+            M[[i, p]] = M[[p, i]]
+        M[i + 1:] -= np.outer(M[i + 1:, i] / M[i, i], M[i])
+        yield i, p, M.copy()
 
-        for j in range(i + 1, n):
-            factor = A[j][i]
-            A[j] = A[j] - factor * A[i]
-            B[j] = B[j] - factor * B[i]
 
-    x = np.zeros(n)
-    for i in range(n - 1, -1, -1):
-        x[i] = B[i] - np.dot(A[i, i + 1:], x[i + 1:])
-    return x
+# GAUSS METHOD
+# THE FACTORIZATION IS COMPUTED ONCE PER MATRIX, THEN ONLY SUBSTITUTIONS ARE DONE
+# trace=True ALSO RETURNS THE LAZY STEP-BY-STEP ELIMINATION
+def gauss_method(A, B, trace=False):
+    lu = lu_factor(A)
+    if lu.singular:
+        print("ERROR: MATRIX IS SINGULAR, SYSTEM HAS NO UNIQUE SOLUTION.")
+        return None
+    if trace:
+        return lu.solve(B), gauss_elimination_steps(A, B)
+    return lu.solve(B)
 
 
 # INVERSE MATRIX
+# A IS INVERTED ONCE, A_inv @ B SOLVES ALL COLUMNS OF B
 def inverse_matrix_method(A, B):
-    det_A = np.linalg.det(A)
-    if det_A == 0:
+    lu = lu_factor(A)
+    if lu.singular:
         print("ERROR: MATRIX HAS NO INVERSE.")
         return None
-    A_inv = np.linalg.inv(A)
-    return np.dot(A_inv, B)
+    return np.dot(lu.inverse(), B)
 
 # MAIN PROGA
-print("SOLVING SYSTEM OF LINEAR EQUATIONS\n")
-
-print("MATRIX A:\n", A)
-print("VECTOR B:\n", B, "\n")
-
-# CRAMER
-print("METHOD OF CRAMER ")
-x_cramer = cramer_method(A, B)
-print("RESULT (CRAMER):", x_cramer, "\n")
-
-# GAUSS
-print("METHOD OF GAUSS ")
-x_gauss = gauss_method(A, B)
-print("RESULT (GAUSS):", x_gauss, "\n")
-
-# INVERSE MATRIX
-print("METHOD OF INVERSE MATRIX ")
-x_inverse = inverse_matrix_method(A, B)
-print("RESULT (INVERSE):", x_inverse, "\n")
-
-print("END OF PROGRAM")
+if __name__ == "__main__":
+    print("SOLVING SYSTEM OF LINEAR EQUATIONS\n")
+
+    print("MATRIX A:\n", A)
+    print("VECTOR B:\n", B, "\n")
+
+    # CRAMER
+    print("METHOD OF CRAMER ")
+    x_cramer = cramer_method(A, B)
+    print("RESULT (CRAMER):", x_cramer, "\n")
+
+    # GAUSS
+    print("METHOD OF GAUSS ")
+    x_gauss, steps = gauss_method(A, B, trace=True)
+    for i, p, M in steps:
+        print(f"STEP {i + 1}: PIVOT ROW {p + 1}\n", M)
+    print("RESULT (GAUSS):", x_gauss, "\n")
+
+    # INVERSE MATRIX
+    print("METHOD OF INVERSE MATRIX ")
+    x_inverse = inverse_matrix_method(A, B)
+    print("RESULT (INVERSE):", x_inverse, "\n")
+
+    # SEVERAL RIGHT-HAND SIDES AT ONCE
+    B_many = np.column_stack([B, 2 * B, A.sum(axis=1)])
+    print("MATRIX OF RIGHT-HAND SIDES:\n", B_many)
+    print("RESULT (GAUSS, ONE COLUMN PER SYSTEM):\n", gauss_method(A, B_many), "\n")
+
+    print("END OF PROGRAM")